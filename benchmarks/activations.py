@@ -0,0 +1,69 @@
+import argparse
+import time
+from typing import Callable, Dict, List, Tuple
+
+from quill.core import Tensor, get_array_module, get_backend, no_grad, set_backend
+from quill.nn.functional import relu, sigmoid, tanh
+
+ACTIVATIONS: Dict[str, Callable[..., Tensor]] = {"relu": relu, "sigmoid": sigmoid, "tanh": tanh}
+
+def synchronize(tensor: Tensor) -> None:
+    # cupy launches asynchronously, the timer must wait for the device
+    xp = get_array_module(tensor.nd)
+    if xp.__name__ == "cupy":
+        xp.cuda.Device().synchronize()
+
+def best_time(fn: Callable[[], Tensor], repeats: int, number: int) -> float:
+    best: float = float("inf")
+    for _ in range(repeats):
+        start: float = time.perf_counter()
+        for _ in range(number):
+            synchronize(fn())
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+def bench(name: str, size: int, repeats: int, number: int) -> List[Tuple[str, float]]:
+    activation: Callable[..., Tensor] = ACTIVATIONS[name]
+    x: Tensor = Tensor(get_backend().random.randn(size))
+
+    def forward() -> Tensor:
+        with no_grad():
+            return activation(x)
+
+    # repeated in-place application keeps the values finite for every activation, so one scratch buffer serves every call
+    scratch: Tensor = Tensor(x.nd.copy())
+
+    def forward_inplace() -> Tensor:
+        with no_grad():
+            return activation(scratch, inplace=True)
+
+    def forward_backward() -> Tensor:
+        leaf: Tensor = Tensor(x.nd, requires_grad=True)
+        y: Tensor = activation(leaf)
+        y.backward()
+        return leaf
+
+    return [
+        ("forward", size / best_time(forward, repeats, number)),
+        ("forward inplace", size / best_time(forward_inplace, repeats, number)),
+        ("forward+backward", size / best_time(forward_backward, repeats, number)),
+    ]
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Throughput of the activation functions in million elements per second.")
+    parser.add_argument("--backend", default=get_backend().__name__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000, 10_000_000])
+    parser.add_argument("--activations", nargs="+", default=list(ACTIVATIONS), choices=list(ACTIVATIONS))
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--number", type=int, default=10)
+    args: argparse.Namespace = parser.parse_args()
+    set_backend(args.backend)
+
+    print(f"{'activation':<12}{'size':>12}{'mode':>20}{'Melem/s':>12}")
+    for name in args.activations:
+        for size in args.sizes:
+            for mode, throughput in bench(name, size, args.repeats, args.number):
+                print(f"{name:<12}{size:>12}{mode:>20}{throughput / 1e6:>12.1f}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
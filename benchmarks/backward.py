@@ -0,0 +1,60 @@
+import argparse
+import sys
+import time
+from typing import List, Tuple
+
+import numpy
+
+from quill.core import Tensor
+from quill.nn.functional import lstm_cell, mseloss
+
+def count_nodes(root: Tensor) -> int:
+    return len(root._topological_order())
+
+def unrolled_lstm(steps: int, batch_size: int, input_size: int, hidden_size: int, rng: numpy.random.Generator) -> Tuple[Tensor, List[Tensor]]:
+    # one lstm_cell per step, so the graph is `steps` cells deep (far beyond the recursion limit for the default 1000 steps)
+    weight_ih: Tensor = Tensor(rng.standard_normal((input_size, 4 * hidden_size)) * 0.1, requires_grad=True)
+    weight_hh: Tensor = Tensor(rng.standard_normal((hidden_size, 4 * hidden_size)) * 0.1, requires_grad=True)
+    bias_ih: Tensor = Tensor(numpy.zeros(4 * hidden_size), requires_grad=True)
+    bias_hh: Tensor = Tensor(numpy.zeros(4 * hidden_size), requires_grad=True)
+    h: Tensor = Tensor(numpy.zeros((batch_size, hidden_size)))
+    c: Tensor = Tensor(numpy.zeros((batch_size, hidden_size)))
+    xs: numpy.ndarray = rng.standard_normal((steps, batch_size, input_size))
+    for t in range(steps):
+        h, c = lstm_cell(Tensor(xs[t]), h, c, weight_ih, weight_hh, bias_ih, bias_hh)
+    return mseloss(h, Tensor(numpy.zeros(h.nd.shape))), [weight_ih, weight_hh, bias_ih, bias_hh]
+
+def bench(steps: int, batch_size: int, input_size: int, hidden_size: int, repeats: int) -> Tuple[int, float, float]:
+    best_forward: float = float("inf")
+    best_backward: float = float("inf")
+    n_nodes: int = 0
+    for _ in range(repeats):
+        rng: numpy.random.Generator = numpy.random.default_rng(0)
+        start: float = time.perf_counter()
+        loss, params = unrolled_lstm(steps, batch_size, input_size, hidden_size, rng)
+        best_forward = min(best_forward, time.perf_counter() - start)
+        n_nodes = count_nodes(loss)
+        start = time.perf_counter()
+        loss.backward()
+        best_backward = min(best_backward, time.perf_counter() - start)
+        if not all(numpy.isfinite(param.grad).all() for param in params):
+            raise AssertionError("Backward produced non-finite gradients.")
+    return n_nodes, best_forward, best_backward
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Backward pass over an unrolled lstm_cell graph, on NumPy.")
+    parser.add_argument("--steps", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--input-size", type=int, default=8)
+    parser.add_argument("--hidden-size", type=int, default=16)
+    parser.add_argument("--repeats", type=int, default=3)
+    args: argparse.Namespace = parser.parse_args()
+
+    print(f"recursion limit {sys.getrecursionlimit()}")
+    print(f"{'steps':>8}{'nodes':>10}{'forward ms':>14}{'backward ms':>14}{'backward us/node':>18}")
+    for steps in args.steps:
+        n_nodes, forward, backward = bench(steps, args.batch_size, args.input_size, args.hidden_size, args.repeats)
+        print(f"{steps:>8}{n_nodes:>10}{forward * 1e3:>14.2f}{backward * 1e3:>14.2f}{backward / n_nodes * 1e6:>18.2f}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,100 @@
+import argparse
+import itertools
+import time
+from typing import Callable, Sequence, Tuple
+
+import numpy
+from numpy import ndarray
+
+from quill.core import Tensor
+from quill.nn.functional import conv3d
+
+# the loop implementation conv3d had before im2col, kept here (ndarray in, ndarray out) as the baseline
+
+def legacy_conv3d(x1: ndarray, x2: ndarray, stride: Sequence[int], padding: Sequence[int]) -> ndarray:
+    if (padding[-2] != 0) or (padding[-1] != 0):
+        x1 = numpy.pad(x1, (*((0, 0) for _ in range(x1.ndim - 2)), (padding[-2], padding[-2]), (padding[-1], padding[-1])))
+    y_height: int = ((x1.shape[-2] - x2.shape[-2]) // stride[-2]) + 1
+    y_width: int = ((x1.shape[-1] - x2.shape[-1]) // stride[-1]) + 1
+    y: ndarray = numpy.zeros((*x1.shape[:-2], y_height, y_width))
+    for i_y, i_x1 in zip(range(y_height), range(0, (x1.shape[-2] - x2.shape[-2] + 1), stride[-2])):
+        for j_y, j_x1 in zip(range(y_width), range(0, (x1.shape[-1] - x2.shape[-1] + 1), stride[-1])):
+            y[..., i_y, j_y] = numpy.sum(x1[..., i_x1:(i_x1 + x2.shape[-2]), j_x1:(j_x1 + x2.shape[-1])] * x2, axis=(-1, -2))
+    return y
+
+def legacy_dilate(x: ndarray, dilation: Sequence[int]) -> ndarray:
+    y_height: int = x.shape[-2] + ((x.shape[-2] - 1) * (dilation[-2] - 1))
+    y_width: int = x.shape[-1] + ((x.shape[-1] - 1) * (dilation[-1] - 1))
+    y: ndarray = numpy.zeros((*x.shape[:-2], y_height, y_width))
+    for i_x, i_y in zip(range(x.shape[-2]), range(0, y_height, dilation[-2])):
+        for j_x, j_y in zip(range(x.shape[-1]), range(0, y_width, dilation[-1])):
+            y[..., i_y, j_y] = x[..., i_x, j_x]
+    return y
+
+def legacy_conv3d_backward(input_nd: ndarray, kernel_nd: ndarray, child_grad: ndarray, stride: Sequence[int], padding: Sequence[int]) -> Tuple[ndarray, ndarray]:
+    grad: ndarray = legacy_dilate(child_grad, stride)
+    outer_padding_height: int = (input_nd.shape[-2] + 2 * padding[-2] - kernel_nd.shape[-2]) % stride[-2]
+    outer_padding_width: int = (input_nd.shape[-1] + 2 * padding[-1] - kernel_nd.shape[-1]) % stride[-1]
+    input_grad: ndarray = legacy_conv3d(grad, numpy.flip(kernel_nd, axis=(-1, -2)), (1, 1), (kernel_nd.shape[-2] - 1, kernel_nd.shape[-1] - 1))
+    input_grad = numpy.pad(input_grad, (*((0, 0) for _ in range(input_grad.ndim - 2)), (0, outer_padding_height), (0, outer_padding_width)))
+    input_grad = input_grad[..., padding[-2]:(padding[-2] + input_nd.shape[-2]), padding[-1]:(padding[-1] + input_nd.shape[-1])]
+    _grad: ndarray = legacy_conv3d(input_nd.reshape((-1, *input_nd.shape[-2:])), grad.reshape((-1, *grad.shape[-2:])), (1, 1), padding)[:, :kernel_nd.shape[-2], :kernel_nd.shape[-1]]
+    n_channel: int = kernel_nd.shape[-3]
+    kernel_grad: ndarray = numpy.stack([_grad[i_channel::n_channel].sum(axis=0) for i_channel in range(n_channel)])
+    return input_grad, kernel_grad
+
+def best_time(fn: Callable[[], object], repeats: int) -> float:
+    best: float = float("inf")
+    for _ in range(repeats):
+        start: float = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def bench(batch_size: int, channels: int, size: int, kernel_size: int, stride: int, padding: int, repeats: int) -> Tuple[float, float, float, float, float]:
+    rng: numpy.random.Generator = numpy.random.default_rng(0)
+    input_nd: ndarray = rng.standard_normal((batch_size, channels, size, size))
+    kernel_nd: ndarray = rng.standard_normal((channels, kernel_size, kernel_size))
+    strides: Tuple[int, int] = (stride, stride)
+    paddings: Tuple[int, int] = (padding, padding)
+
+    def forward_backward() -> Tuple[ndarray, ndarray, ndarray]:
+        x: Tensor = Tensor(input_nd, requires_grad=True)
+        k: Tensor = Tensor(kernel_nd, requires_grad=True)
+        y: Tensor = conv3d(x, k, strides, paddings)
+        y.accumulate_grad(numpy.ones(y.nd.shape))
+        y.grad_fn(y)
+        return y.nd, x.grad, k.grad
+
+    def legacy_forward_backward() -> Tuple[ndarray, ndarray, ndarray]:
+        y: ndarray = legacy_conv3d(input_nd, kernel_nd, strides, paddings)
+        return (y, *legacy_conv3d_backward(input_nd, kernel_nd, numpy.ones(y.shape), strides, paddings))
+
+    # both implementations must agree before their timings mean anything
+    error: float = max(float(numpy.abs(new - old).max()) for new, old in zip(forward_backward(), legacy_forward_backward()))
+    return (
+        best_time(lambda: legacy_conv3d(input_nd, kernel_nd, strides, paddings), repeats),
+        best_time(lambda: conv3d(Tensor(input_nd), Tensor(kernel_nd), strides, paddings), repeats),
+        best_time(legacy_forward_backward, repeats),
+        best_time(forward_backward, repeats),
+        error,
+    )
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="conv3d: the loop implementation against im2col, forward and forward+backward on NumPy.")
+    parser.add_argument("--batch-size", type=int, default=4)
+    parser.add_argument("--channels", type=int, default=3)
+    parser.add_argument("--kernel-size", type=int, default=3)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[32, 64, 128])
+    parser.add_argument("--strides", type=int, nargs="+", default=[1, 2])
+    parser.add_argument("--paddings", type=int, nargs="+", default=[0, 1])
+    parser.add_argument("--repeats", type=int, default=3)
+    args: argparse.Namespace = parser.parse_args()
+
+    print(f"{'size':>6}{'stride':>8}{'padding':>9}{'loop fwd ms':>14}{'im2col fwd ms':>16}{'speedup':>9}{'loop f+b ms':>14}{'im2col f+b ms':>16}{'speedup':>9}{'max err':>10}")
+    for size, stride, padding in itertools.product(args.sizes, args.strides, args.paddings):
+        legacy_forward, forward, legacy_forward_backward, forward_backward, error = bench(args.batch_size, args.channels, size, args.kernel_size, stride, padding, args.repeats)
+        print(f"{size:>6}{stride:>8}{padding:>9}{legacy_forward * 1e3:>14.2f}{forward * 1e3:>16.2f}{legacy_forward / forward:>8.1f}x{legacy_forward_backward * 1e3:>14.2f}{forward_backward * 1e3:>16.2f}{legacy_forward_backward / forward_backward:>8.1f}x{error:>10.1e}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
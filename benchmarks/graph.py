@@ -0,0 +1,83 @@
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+import numpy
+
+from quill.core import Tensor
+from quill.nn.functional import add
+from quill.nn.functional._broadcast import accumulate_broadcast_grad
+
+class DictTensor(Tensor):
+    # a subclass without __slots__ gets a per-instance __dict__ again, the layout graph nodes had before
+    pass
+
+def dict_add(x1: Tensor, x2: Tensor) -> Tensor:
+    def grad_fn(child: Tensor) -> None:
+        accumulate_broadcast_grad(x1, child.grad)
+        accumulate_broadcast_grad(x2, child.grad)
+
+    return DictTensor(x1.xp.asarray(x1.nd + x2.nd), [x1, x2], grad_fn=grad_fn)
+
+NODES: Dict[str, Callable[[Tensor, Tensor], Tensor]] = {"__dict__": dict_add, "__slots__": add}
+
+def build(op: Callable[[Tensor, Tensor], Tensor], x: Tensor, n_nodes: int) -> Tensor:
+    y: Tensor = x
+    for _ in range(n_nodes):
+        y = op(y, x)
+    return y
+
+def bench(op: Callable[[Tensor, Tensor], Tensor], n_nodes: int, repeats: int) -> Tuple[float, float, int]:
+    x: Tensor = Tensor(numpy.ones(2), requires_grad=True)
+
+    # every node allocated during the build stays alive in the chain, so the traced memory at the end is what the graph holds
+    tracemalloc.start()
+    base: int = tracemalloc.get_traced_memory()[0]
+    y: Tensor = build(op, x, n_nodes)
+    per_node: float = (tracemalloc.get_traced_memory()[0] - base) / n_nodes
+    tracemalloc.stop()
+    del y
+
+    gen0: List[int] = [0]
+
+    def count(phase: str, info: Dict[str, int]) -> None:
+        if (phase == "start") and (info["generation"] == 0):
+            gen0[0] += 1
+
+    best: float = float("inf")
+    passes: int = 0
+    for _ in range(repeats):
+        gc.collect()
+        gen0[0] = 0
+        gc.callbacks.append(count)
+        start: float = time.perf_counter()
+        y = build(op, x, n_nodes)
+        elapsed: float = time.perf_counter() - start
+        gc.callbacks.remove(count)
+        if elapsed < best:
+            best, passes = elapsed, gen0[0]
+        del y
+
+    # both layouts record the same graph, so backward must give the same gradient
+    x.grad = None
+    build(op, x, n_nodes).backward()
+    if not numpy.allclose(x.grad, n_nodes + 1):
+        raise AssertionError(f"Graph built with `{op.__name__}` gives a wrong gradient.")
+    return per_node, best, passes
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Memory, build time and gen-0 GC passes of a long add chain, per-instance __dict__ vs __slots__ nodes, on NumPy.")
+    parser.add_argument("--nodes", type=int, default=50000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args: argparse.Namespace = parser.parse_args()
+
+    print(f"{args.nodes} node add chain on 2-element tensors")
+    print(f"{'layout':>10}{'B/node':>10}{'build ms':>10}{'gen-0 GC':>10}")
+    for layout, op in NODES.items():
+        per_node, build_time, passes = bench(op, args.nodes, args.repeats)
+        print(f"{layout:>10}{per_node:>10.0f}{build_time * 1e3:>10.1f}{passes:>10}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
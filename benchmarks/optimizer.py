@@ -0,0 +1,79 @@
+import argparse
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+import numpy
+from numpy import ndarray
+
+from quill.core import Tensor
+from quill.nn import LSTM, Conv2d, Module, Sequential
+from quill.optim import SGD, Optimizer
+
+MODELS: Dict[str, Callable[[], Module]] = {
+    "conv": lambda: Sequential(Conv2d(3, 32, 3), Conv2d(32, 64, 3), Conv2d(64, 64, 3)),
+    "lstm": lambda: LSTM(128, 256, num_layers=2),
+}
+
+class LegacySGD(SGD):
+
+    # the optimizer before in-place zeroing: every zero_grad allocates fresh grads, every update builds lr * grad and momentum * velocity temporaries
+    def zero_grad(self, set_to_none: bool = True) -> None:
+        for x in self.flat_params:
+            x.grad = x.xp.zeros_like(x.nd)
+
+    def update(self, param: ndarray, grad: ndarray, *state: ndarray) -> None:
+        if self.momentum != 0:
+            state[0][...] = self.momentum * state[0] + self.lr * grad
+            param -= state[0]
+        else:
+            param -= self.lr * grad
+
+def iteration(optimizer: Optimizer, grads: List[Tuple[Tensor, ndarray]]) -> None:
+    # stands in for backward: gradients are accumulated into whatever buffers zero_grad left behind
+    optimizer.zero_grad(set_to_none=False)
+    for x, grad in grads:
+        x.ensure_grad()
+        x.grad += grad
+    optimizer.step()
+
+def bench(model_name: str, optimizer_cls: type, iterations: int, repeats: int) -> Tuple[int, float, float]:
+    model: Module = MODELS[model_name]()
+    params: List[Tensor] = model.flat_parameters()
+    optimizer: Optimizer = optimizer_cls(params, lr=0.01, momentum=0.9)
+    rng: numpy.random.Generator = numpy.random.default_rng(0)
+    grads: List[Tuple[Tensor, ndarray]] = [(x, rng.standard_normal(x.nd.shape)) for x in params]
+
+    # the first iteration allocates grads, velocities and scratch for both optimizers, only the steady state is measured
+    iteration(optimizer, grads)
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    base: int = tracemalloc.get_traced_memory()[0]
+    for _ in range(iterations):
+        iteration(optimizer, grads)
+    peak: int = tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+
+    best: float = float("inf")
+    for _ in range(repeats):
+        start: float = time.perf_counter()
+        for _ in range(iterations):
+            iteration(optimizer, grads)
+        best = min(best, (time.perf_counter() - start) / iterations)
+    return sum(x.nd.size for x in params), peak, best
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Allocator traffic and step time of SGD with momentum, legacy temporaries vs in-place updates, on NumPy.")
+    parser.add_argument("--models", nargs="+", default=list(MODELS), choices=list(MODELS))
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--repeats", type=int, default=5)
+    args: argparse.Namespace = parser.parse_args()
+
+    print(f"{'model':>8}{'params':>10}{'optimizer':>12}{'peak MB':>10}{'step ms':>10}")
+    for model_name in args.models:
+        for optimizer_cls in (LegacySGD, SGD):
+            n_params, peak, step = bench(model_name, optimizer_cls, args.iterations, args.repeats)
+            print(f"{model_name:>8}{n_params:>10}{optimizer_cls.__name__:>12}{peak / 2 ** 20:>10.2f}{step * 1e3:>10.3f}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,62 @@
+import argparse
+import time
+from typing import Callable, Dict, List, Tuple
+
+import numpy
+
+from quill.core import Tensor
+from quill.internals import get_validation_level, set_validation_level
+from quill.nn import Linear
+from quill.nn.functional import add, matmul
+
+LEVELS: Tuple[str, ...] = ("full", "boundary", "off")
+
+def best_time(fn: Callable[[], object], repeats: int, number: int) -> float:
+    best: float = float("inf")
+    for _ in range(repeats):
+        start: float = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+def cases(size: int) -> Dict[str, Callable[[], object]]:
+    # small operands, so the time is dominated by per-call python overhead (the checks among it) rather than by numpy
+    rng: numpy.random.Generator = numpy.random.default_rng(0)
+    nd: numpy.ndarray = rng.standard_normal((size, size))
+    x1: Tensor = Tensor(nd, requires_grad=True)
+    x2: Tensor = Tensor(rng.standard_normal((size, size)), requires_grad=True)
+    linear: Linear = Linear(size, size)
+    return {
+        "add": lambda: add(x1, x2),
+        "matmul": lambda: matmul(x1, x2),
+        "Tensor": lambda: Tensor(nd),
+        "Linear": lambda: linear(x1),
+    }
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Small-tensor op latency at every validation level, on NumPy.")
+    parser.add_argument("--size", type=int, default=4)
+    parser.add_argument("--levels", nargs="+", default=list(LEVELS), choices=list(LEVELS))
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--number", type=int, default=10000)
+    args: argparse.Namespace = parser.parse_args()
+
+    fns: Dict[str, Callable[[], object]] = cases(args.size)
+    initial: str = get_validation_level()
+    results: Dict[str, List[float]] = {name: [] for name in fns}
+    try:
+        for level in args.levels:
+            set_validation_level(level)
+            for name, fn in fns.items():
+                results[name].append(best_time(fn, args.repeats, args.number))
+    finally:
+        set_validation_level(initial)
+
+    print(f"{args.size}x{args.size} operands, us per call")
+    print(f"{'op':>8}" + "".join(f"{level:>10}" for level in args.levels))
+    for name, times in results.items():
+        print(f"{name:>8}" + "".join(f"{t * 1e6:>10.2f}" for t in times))
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -1 +1,3 @@
-from . import core, internals, nn, optim, utils
\ No newline at end of file
+from . import core, internals, nn, optim, utils
+
+from .core import is_grad_enabled, no_grad, set_grad_enabled
\ No newline at end of file
@@ -1 +1,4 @@
-from ._tensor import Tensor
\ No newline at end of file
+from ._backend import available_backends, get_array_module, get_backend, ndarray_types, set_backend, to_backend
+from ._grad_mode import is_grad_enabled, no_grad, set_grad_enabled
+from ._tensor import Tensor
+from ._parameters import flatten_parameters
\ No newline at end of file
@@ -0,0 +1,49 @@
+from types import ModuleType
+from typing import Any, Dict, List, Tuple, Union
+import numpy
+
+try:
+    import cupy
+    if not cupy.cuda.is_available():
+        cupy = None
+except ImportError:
+    cupy = None
+
+_backends: Dict[str, ModuleType] = {"numpy": numpy}
+if cupy is not None:
+    _backends["cupy"] = cupy
+
+# cupy is preferred whenever a device is available, numpy otherwise
+_backend: ModuleType = _backends.get("cupy", numpy)
+
+ndarray_types: Tuple[type, ...] = tuple(backend.ndarray for backend in _backends.values())
+
+def available_backends() -> List[str]:
+    return list(_backends)
+
+def _resolve_backend(backend: Union[str, ModuleType]) -> ModuleType:
+    if isinstance(backend, ModuleType):
+        backend = backend.__name__
+    if backend not in _backends:
+        raise ValueError(f"Backend `{backend}` is not available, it must be one of these backends: `{available_backends()}`.")
+    return _backends[backend]
+
+def get_backend() -> ModuleType:
+    return _backend
+
+def set_backend(backend: Union[str, ModuleType]) -> None:
+    global _backend
+    _backend = _resolve_backend(backend)
+
+def get_array_module(*arrays: Any) -> ModuleType:
+    if cupy is not None:
+        return cupy.get_array_module(*arrays)
+    return numpy
+
+def to_backend(nd: Any, backend: Union[str, ModuleType]) -> Any:
+    xp: ModuleType = _resolve_backend(backend)
+    if get_array_module(nd) is xp:
+        return nd
+    if xp is numpy:
+        return cupy.asnumpy(nd)
+    return xp.asarray(nd)
\ No newline at end of file
@@ -0,0 +1,20 @@
+from threading import local
+from typing import Any
+
+# grad mode is tracked per thread so background loader threads never disable it for the training thread
+_state: local = local()
+
+def is_grad_enabled() -> bool:
+    return getattr(_state, "enabled", True)
+
+def set_grad_enabled(mode: bool) -> None:
+    _state.enabled = mode
+
+class no_grad:
+
+    def __enter__(self) -> None:
+        self.prev: bool = is_grad_enabled()
+        set_grad_enabled(False)
+
+    def __exit__(self, *args: Any) -> None:
+        set_grad_enabled(self.prev)
\ No newline at end of file
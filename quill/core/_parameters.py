@@ -0,0 +1,26 @@
+from typing import Dict, List, Set, Union
+
+from ._tensor import Tensor
+
+_State = Union[Tensor, Dict[str, "_State"]]
+
+def flatten_parameters(params: Union[_State, List[Tensor]]) -> List[Tensor]:
+
+    # depth-first walk over the nested state, tensors shared between submodules are kept once (by identity)
+    tensors: List[Tensor] = []
+    visited: Set[int] = set()
+    stack: List[Union[_State, List[Tensor]]] = [params]
+    while len(stack) > 0:
+        v: Union[_State, List[Tensor]] = stack.pop()
+        if id(v) in visited:
+            continue
+        visited.add(id(v))
+        if isinstance(v, dict):
+            stack.extend(reversed(list(v.values())))
+        elif isinstance(v, list):
+            stack.extend(reversed(v))
+        elif isinstance(v, Tensor):
+            tensors.append(v)
+        else:
+            raise ValueError(f"Parameters must be tensors, they cannot be of type `{type(v).__name__}`.")
+    return tensors
\ No newline at end of file
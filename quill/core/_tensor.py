@@ -1,43 +1,113 @@
-from typing import Callable, Dict, List
+from types import ModuleType
+from typing import Callable, List, Set, Tuple, Union
 from typing_extensions import Self
-from cupy import ndarray as cdarray, zeros
 from numpy import ndarray
 
-from ..internals import type_check
+from ._backend import get_array_module, ndarray_types, to_backend
+from ._grad_mode import is_grad_enabled
+from ..internals import op_checks_enabled, type_check
 
 class Tensor:
 
-    def __init__(self, nd: ndarray, parents: List[Self] = [], grad_fn: Callable[[Self], None] = None, split_idx: int = -1) -> None:
+    # no per-instance __dict__, graph nodes are created for every op
+    __slots__ = ("nd", "parents", "grad_fn", "grad", "requires_grad", "grad_base", "graph_released")
+
+    def __init__(self, nd: ndarray, parents: List[Self] = [], grad_fn: Callable[[Self], None] = None, requires_grad: bool = False, grad_base: Union[Tuple[Self, Tuple[Union[int, slice, None], ...]], None] = None) -> None:
 
         # TYPE CHECKS
-        type_check(nd, "nd", cdarray)
-        type_check(parents, "parents", list, Tensor)
-        type_check(split_idx, "split_idx", int)
-        
+        if op_checks_enabled():
+            type_check(nd, "nd", ndarray_types)
+            type_check(parents, "parents", list, Tensor)
+            type_check(requires_grad, "requires_grad", bool)
+            type_check(grad_base, "grad_base", (tuple, type(None)))
+
+        # a leaf keeps the requires_grad it was created with (parameters built under no_grad still train),
+        # a result requires grad if any parent does, no graph is recorded for constants or while grad mode is disabled
+        if len(parents) == 0:
+            self.requires_grad: bool = requires_grad
+        else:
+            self.requires_grad = is_grad_enabled() and (requires_grad or any(parent.requires_grad for parent in parents))
+        if not self.requires_grad:
+            parents = []
+            grad_fn = None
+            grad_base = None
+
         self.nd: ndarray = nd
         self.parents: List[Tensor] = parents
         self.grad_fn: Callable = grad_fn
-        self.grad: ndarray = zeros(nd.shape)
-        self.split_idx: int = split_idx
-        self.i_backward: int = 0
-        self.n_backward: int = 0
-        for parent in parents:
-            parent.n_backward += 1
-        from ..optim import Optimizer
-        self.velocities: Dict[Optimizer, ndarray] = {}
-
-    def _backward(self) -> None:
-        self.i_backward += 1
-        if self.i_backward > self.n_backward:
-            raise AssertionError(f"Backpropagation error found: too many backward calls to a tensor (i_backward={self.i_backward}, n_backward={self.n_backward}).")
-        elif (self.i_backward == self.n_backward) and (self.grad_fn is not None):
-            self.grad_fn(self)
-            for parent in self.parents:
-                parent._backward()
-
-    def backward(self) -> None:
-        _n_backward: int = self.n_backward
-        self.n_backward = 1
-        self.grad += 1
-        self._backward()
-        self.n_backward = _n_backward
\ No newline at end of file
+        self.grad: Union[ndarray, None] = None
+
+        # view ops pass (base, index): the gradient of this tensor is stored as the view base.grad[index], so it accumulates straight into the base
+        self.grad_base: Union[Tuple[Tensor, Tuple[Union[int, slice, None], ...]], None] = grad_base
+
+        # set once a backward pass frees the graph behind this tensor, a later backward through it would silently stop here
+        self.graph_released: bool = False
+
+    @property
+    def xp(self) -> ModuleType:
+        return get_array_module(self.nd)
+
+    def to(self, backend: Union[str, ModuleType]) -> Self:
+        self.nd = to_backend(self.nd, backend)
+        if self.grad is not None:
+            self.grad = to_backend(self.grad, backend)
+        return self
+
+    def ensure_grad(self) -> ndarray:
+        # gradient storage is only allocated once a gradient actually flows into this tensor
+        if self.grad is None:
+            if self.grad_base is not None:
+                base, index = self.grad_base
+                self.grad = base.ensure_grad()[index]
+            else:
+                self.grad = self.xp.zeros(self.nd.shape)
+        return self.grad
+
+    def accumulate_grad(self, grad: ndarray) -> None:
+        if not self.requires_grad:
+            return
+        if (self.grad is None) and (self.grad_base is None):
+            self.grad = self.xp.empty(self.nd.shape, dtype=grad.dtype)
+            self.grad[...] = grad
+        else:
+            self.ensure_grad()
+            self.grad += grad
+
+    def _topological_order(self) -> List[Self]:
+        
+        # iterative depth-first search, a tensor is appended once all of its parents have been appended
+        order: List[Tensor] = []
+        visited: Set[Tensor] = set()
+        stack: List[Tuple[Tensor, bool]] = [(self, False)]
+        while len(stack) > 0:
+            tensor, expanded = stack.pop()
+            if expanded:
+                order.append(tensor)
+            elif tensor not in visited:
+                visited.add(tensor)
+                stack.append((tensor, True))
+                stack.extend((parent, False) for parent in tensor.parents if parent not in visited)
+        return order
+
+    def backward(self, retain_graph: bool = False) -> None:
+        type_check(retain_graph, "retain_graph", bool)
+        if not self.requires_grad:
+            raise AssertionError("Backpropagation error found: tensor does not require grad and has no gradient graph.")
+        order: List[Tensor] = self._topological_order()
+        if any(tensor.graph_released for tensor in order):
+            raise AssertionError("Backpropagation error found: the graph was already freed by a previous backward, call the earlier backward with `retain_graph=True` to backpropagate through it again.")
+        self.accumulate_grad(self.xp.ones(self.nd.shape))
+
+        # children before parents, every grad_fn runs exactly once (and not at all if no gradient reached its tensor)
+        for tensor in reversed(order):
+            if len(tensor.parents) > 0:
+                if (tensor.grad_fn is not None) and (tensor.grad is not None):
+                    tensor.grad_fn(tensor)
+
+                # the intermediate grad and (unless retained) the graph behind this tensor are no longer needed
+                tensor.grad = None
+                if not retain_graph:
+                    tensor.grad_fn = None
+                    tensor.grad_base = None
+                    tensor.parents = []
+                    tensor.graph_released = True
\ No newline at end of file
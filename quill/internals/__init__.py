@@ -1,3 +1,4 @@
+from ._validation import boundary_checks_enabled, get_validation_level, op_checks_enabled, set_validation_level
 from ._expr_check import expr_check
 from ._len_check import len_check
 from ._type_check import type_check
\ No newline at end of file
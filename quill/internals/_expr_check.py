@@ -1,8 +1,12 @@
 from inspect import getsource
 from typing import Callable, TypeVar
 
+from ._validation import boundary_checks_enabled
+
 T = TypeVar("T")
 
 def expr_check(obj: T, nameof_obj: str, expr: Callable[[T], bool]) -> None:
+    if not boundary_checks_enabled():
+        return
     if not expr(obj):
         raise ValueError(f"`{nameof_obj}` does not satisfy the following expression:\n{getsource(expr)}")
\ No newline at end of file
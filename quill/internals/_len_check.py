@@ -1,5 +1,9 @@
 from typing import Any
 
+from ._validation import boundary_checks_enabled
+
 def len_check(obj: Any, nameof_obj: str, length: int) -> None:
+    if not boundary_checks_enabled():
+        return
     if len(obj) != length:
         raise IndexError(f"If `{nameof_obj}` is a `{type(obj).__name__}`, it must be of length = {length}.")
\ No newline at end of file
@@ -0,0 +1,26 @@
+import os
+from typing import Tuple
+
+# full: every check runs, including per-op and per-Tensor checks inside the graph
+# boundary: only checks at construction time and public entry points (modules, optimizers, datasets) run
+# off: no checks run at all
+VALIDATION_LEVELS: Tuple[str, ...] = ("full", "boundary", "off")
+
+_level: str = os.environ.get("QUILL_VALIDATION", "full")
+if _level not in VALIDATION_LEVELS:
+    raise ValueError(f"`QUILL_VALIDATION` must be one of these levels: `{VALIDATION_LEVELS}`, it cannot be `{_level}`.")
+
+def get_validation_level() -> str:
+    return _level
+
+def set_validation_level(level: str) -> None:
+    global _level
+    if level not in VALIDATION_LEVELS:
+        raise ValueError(f"`level` must be one of these levels: `{VALIDATION_LEVELS}`, it cannot be `{level}`.")
+    _level = level
+
+def op_checks_enabled() -> bool:
+    return _level == "full"
+
+def boundary_checks_enabled() -> bool:
+    return _level != "off"
\ No newline at end of file
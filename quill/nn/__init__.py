@@ -2,6 +2,7 @@ from . import functional
 
 from ._module import Module
 
+from ._adaptive_avgpool2d import AdaptiveAvgPool2d
 from ._avgpool2d import AvgPool2d
 from ._conv2d import Conv2d
 from ._linear import Linear
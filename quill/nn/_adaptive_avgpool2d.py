@@ -0,0 +1,32 @@
+from typing import Sequence, Tuple, Union
+
+from . import Module
+from .functional import adaptive_avgpool3d
+from ..core import Tensor
+from ..internals import expr_check, len_check, type_check
+
+class AdaptiveAvgPool2d(Module):
+
+    def __init__(self, output_size: Union[int, Sequence[int]]) -> None:
+
+        # Initialize parent class
+        super().__init__()
+
+        # TYPE CHECKS
+        type_check(output_size, "output_size", (int, Sequence), int)
+
+        # cast output_size into tuple
+        if isinstance(output_size, int):
+            output_size = (output_size, output_size)
+
+        # MISMATCHED DIMENSION CHECKS
+        len_check(output_size, "output_size", 2)
+
+        # VALUE OUT OF RANGE CHECKS
+        for i_output_size in range(len(output_size)):
+            expr_check(output_size[i_output_size], f"output_size[{i_output_size}]", lambda x: x > 0)
+
+        self.output_size: Tuple[int, int] = output_size
+
+    def forward(self, x: Tensor) -> Tensor:
+        return adaptive_avgpool3d(x, self.output_size)
\ No newline at end of file
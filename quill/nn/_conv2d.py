@@ -1,9 +1,8 @@
-from typing import List, Sequence, Tuple, Union
-from cupy.random import rand
+from typing import Sequence, Tuple, Union
 
 from . import Module
-from .functional import addbias, conv3d, sum, stack, unstack
-from ..core import Tensor
+from .functional import conv2d
+from ..core import Tensor, get_backend
 from ..internals import expr_check, len_check, type_check
 
 class Conv2d(Module):
@@ -50,16 +49,10 @@ class Conv2d(Module):
         self.stride: Tuple[int, int] = stride
         self.padding: Tuple[int, int] = padding
         
-        self.weight: Tensor = Tensor(rand(output_channels, input_channels, kernel_size[0], kernel_size[1]))
+        self.weight: Tensor = Tensor(get_backend().random.rand(output_channels, input_channels, kernel_size[0], kernel_size[1]), requires_grad=True)
         self.bias: Union[Tensor, None] = None
         if bias:
-            self.bias = Tensor(rand(output_channels))
+            self.bias = Tensor(get_backend().random.rand(output_channels), requires_grad=True)
 
     def forward(self, x: Tensor) -> Tensor:
-        _y: List[Tensor] = []
-        for w in unstack(self.weight, axis=0):
-            _y.append(sum(conv3d(x, w, self.stride, self.padding), axis=-3))
-        y: Tensor = stack(_y, axis=-3)
-        if self.bias is not None:
-            y = addbias(y, self.bias, axis=-3)
-        return y
\ No newline at end of file
+        return conv2d(x, self.weight, self.bias, self.stride, self.padding)
\ No newline at end of file
@@ -1,9 +1,8 @@
 from typing import Union
-from cupy.random import rand
 
 from . import Module
-from .functional import addbias, expand_dims, matmul, squeeze
-from ..core import Tensor
+from .functional import add, matmul
+from ..core import Tensor, get_backend
 from ..internals import expr_check, type_check
 
 class Linear(Module):
@@ -25,13 +24,14 @@ class Linear(Module):
         self.input_size: int = input_size
         self.output_size: int = output_size
 
-        self.weight: Tensor = Tensor(rand(input_size, output_size))
+        self.weight: Tensor = Tensor(get_backend().random.rand(input_size, output_size), requires_grad=True)
         self.bias: Union[Tensor, None] = None
         if bias:
-            self.bias = Tensor(rand(output_size))
+            self.bias = Tensor(get_backend().random.rand(output_size), requires_grad=True)
 
     def forward(self, x: Tensor) -> Tensor:
-        y: Tensor = squeeze(matmul(expand_dims(x, -2), self.weight), -2)
+        # (..., input_size) @ (input_size, output_size) and the bias broadcast over the leading axes, no expand_dims/squeeze nodes
+        y: Tensor = matmul(x, self.weight)
         if self.bias is not None:
-            y = addbias(y, self.bias)
+            y = add(y, self.bias)
         return y
\ No newline at end of file
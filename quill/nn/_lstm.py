@@ -1,8 +1,7 @@
 from typing import List, Tuple, Union
-from cupy import zeros
 
 from . import Module, Linear
-from .functional import add, multiply, sigmoid, split, squeeze, stack, tanh
+from .functional import concatenate, lstm, lstm_cell, split, unstack
 from ..core import Tensor
 from ..internals import type_check, expr_check
 
@@ -30,16 +29,10 @@ class _Cell(Module):
         self.W: Linear = Linear(hidden_size, hidden_size * 4, bias=bias)
     
     def forward(self, x: Tensor, hc: Tuple[Tensor, Tensor]) -> Tuple[Tensor, Tensor]:
-        _h, _c = hc
-        x_f, x_i, x_c, x_o = split(self.U(x), 4, axis=-1)
-        h_f, h_i, h_c, h_o = split(self.W(_h), 4, axis=-1)
-        f: Tensor = sigmoid(add(x_f, h_f))
-        i: Tensor = sigmoid(add(x_i, h_i))
-        o: Tensor = sigmoid(add(x_o, h_o))
-        c_tilde: Tensor = tanh(add(x_c, h_c))
-        c: Tensor = add(multiply(f, _c), multiply(i, c_tilde))
-        h: Tensor = multiply(o, tanh(c))
-        return h, c
+        return lstm_cell(x, hc[0], hc[1], self.U.weight, self.W.weight, self.U.bias, self.W.bias)
+
+    def forward_sequence(self, x: Tensor, hc: Tuple[Tensor, Tensor]) -> Tuple[Tensor, Tensor]:
+        return lstm(x, hc[0], hc[1], self.U.weight, self.W.weight, self.U.bias, self.W.bias)
 
 class LSTM(Module):
 
@@ -72,24 +65,26 @@ class LSTM(Module):
     def forward(self, x: Tensor, hc: Union[Tuple[Tensor, Tensor], None] = None) -> Tuple[Tensor, Tuple[Tensor, Tensor]]:
         
         if hc is None:
-            hc = (Tensor(zeros((*x.nd.shape[:-2], self.hidden_size))), Tensor(zeros((*x.nd.shape[:-2], self.hidden_size))))
+            hc = (Tensor(x.xp.zeros((*x.nd.shape[:-2], self.hidden_size))), Tensor(x.xp.zeros((*x.nd.shape[:-2], self.hidden_size))))
+        
+        # initial states are either shared by every layer (..., hidden_size) or given per layer (..., num_layers, hidden_size)
+        _h_0: List[Tensor] = [hc[0] for _ in range(self.num_layers)]
+        _c_0: List[Tensor] = [hc[1] for _ in range(self.num_layers)]
+        if hc[0].nd.ndim == x.nd.ndim:
+            _h_0 = unstack(hc[0], axis=-2)
+        if hc[1].nd.ndim == x.nd.ndim:
+            _c_0 = unstack(hc[1], axis=-2)
         
-        _x: List[Tensor] = [squeeze(tensor, -2) for tensor in split(x, x.nd.shape[-2], -2)]
-        n: int = len(_x)
-        _y: List[Tensor] = []
+        # each layer runs over the whole sequence at once, its input projection is a single GEMM
+        n: int = x.nd.shape[-2]
+        y: Tensor = x
         _h_n: List[Tensor] = []
         _c_n: List[Tensor] = []
-        for t in range(n):
-            h: Tensor = _x[t]
-            for cell in self.cells:
-                hc = cell(h, hc)
-                h = hc[0]
-                if (t + 1) == n:
-                    _h_n.append(hc[0])
-                    _c_n.append(hc[1])
-            _y.append(h)
+        for cell, h_0, c_0 in zip(self.cells, _h_0, _c_0):
+            y, c = cell.forward_sequence(y, (h_0, c_0))
+            _h_n.append(split(y, [n - 1], axis=-2)[1])
+            _c_n.append(split(c, [n - 1], axis=-2)[1])
         
-        y: Tensor = stack(_y, axis=-2)
-        h_n: Tensor = stack(_h_n, axis=-2)
-        c_n: Tensor = stack(_c_n, axis=-2)
+        h_n: Tensor = concatenate(_h_n, axis=-2)
+        c_n: Tensor = concatenate(_c_n, axis=-2)
         return y, (h_n, c_n)
\ No newline at end of file
@@ -1,6 +1,9 @@
-from typing import Any, Dict, Union
+from types import ModuleType
+from typing import Any, Dict, List, Union
+from typing_extensions import Self
 
-from ..core import Tensor
+from ..core import Tensor, flatten_parameters, no_grad
+from ..internals import type_check
 
 _State = Union[Tensor, Dict[str, "_State"]]
 
@@ -8,12 +11,29 @@ class Module:
 
     def __init__(self) -> None:
         self.training: bool = True
+        self.inference_mode: bool = False
         
     def train(self) -> None:
         self.training = True
+        for v in vars(self).values():
+            if isinstance(v, Module):
+                v.train()
     
     def eval(self) -> None:
         self.training = False
+        for v in vars(self).values():
+            if isinstance(v, Module):
+                v.eval()
+    
+    def inference(self, mode: bool = True) -> Self:
+        type_check(mode, "mode", bool)
+
+        # inference mode is separate from eval(): an eval-mode module still builds a graph (input gradients, fine-tuning), an inference-mode module never does
+        self.inference_mode = mode
+        for v in vars(self).values():
+            if isinstance(v, Module):
+                v.inference(mode)
+        return self
     
     def forward(self, x: Tensor, *args) -> Tensor:
         raise NotImplementedError(f"Forward function for module type {type(self).__name__} has not been implemented yet.")
@@ -26,8 +46,35 @@ class Module:
             elif isinstance(v, Module):
                 state_dict[k] = v.parameters()
         return state_dict
+
+    def flat_parameters(self) -> List[Tensor]:
+        return flatten_parameters(self.parameters())
     
+    def to(self, backend: Union[str, ModuleType]) -> Self:
+        for v in vars(self).values():
+            if isinstance(v, (Tensor, Module)):
+                v.to(backend)
+        return self
+
+    def set_requires_grad(self, requires_grad: bool) -> Self:
+        type_check(requires_grad, "requires_grad", bool)
+
+        # frozen parameters are treated as constants, no graph is recorded behind them
+        for v in vars(self).values():
+            if isinstance(v, Tensor):
+                v.requires_grad = requires_grad
+                v.grad = None
+            elif isinstance(v, Module):
+                v.set_requires_grad(requires_grad)
+        return self
+
     def __call__(self, x: Tensor, *args) -> Tensor:
+        # modules are the boundary, the functional ops inside forward only check themselves at the full validation level
+        type_check(x, "x", Tensor)
+
+        if self.inference_mode:
+            with no_grad():
+                return self.forward(x, *args)
         return self.forward(x, *args)
 
     def __repr__(self) -> str:
@@ -1,11 +1,19 @@
 from . import Module
 from .functional import relu
 from ..core import Tensor
+from ..internals import type_check
 
 class ReLU(Module):
 
-    def __init__(self) -> None:
+    def __init__(self, inplace: bool = False) -> None:
+
+        # Initialize parent class
         super().__init__()
+
+        # TYPE CHECKS
+        type_check(inplace, "inplace", bool)
+
+        self.inplace: bool = inplace
     
     def forward(self, x: Tensor) -> Tensor:
-        return relu(x)
\ No newline at end of file
+        return relu(x, self.inplace)
\ No newline at end of file
@@ -1,11 +1,19 @@
 from . import Module
 from .functional import sigmoid
 from ..core import Tensor
+from ..internals import type_check
 
 class Sigmoid(Module):
 
-    def __init__(self) -> None:
+    def __init__(self, inplace: bool = False) -> None:
+
+        # Initialize parent class
         super().__init__()
+
+        # TYPE CHECKS
+        type_check(inplace, "inplace", bool)
+
+        self.inplace: bool = inplace
     
     def forward(self, x: Tensor) -> Tensor:
-        return sigmoid(x)
\ No newline at end of file
+        return sigmoid(x, self.inplace)
\ No newline at end of file
@@ -1,20 +1,31 @@
+from ._adaptive_avgpool3d import adaptive_avgpool3d
 from ._add import add
 from ._addbias import addbias
 from ._avgpool3d import avgpool3d
+from ._bcewithlogitsloss import bcewithlogitsloss
 from ._concatenate import concatenate
+from ._conv2d import conv2d
 from ._conv3d import conv3d
+from ._crossentropyloss import crossentropyloss
+from ._divide import divide
 from ._expand_dims import expand_dims
 from ._flatten import flatten
+from ._lstm import lstm
+from ._lstm_cell import lstm_cell
 from ._matmul import matmul
 from ._maxpool3d import maxpool3d
+from ._maximum import maximum
+from ._mean import mean
 from ._mseloss import mseloss
 from ._multiply import multiply
+from ._power import power
 from ._relu import relu
 from ._reshape import reshape
 from ._sigmoid import sigmoid
 from ._split import split
 from ._squeeze import squeeze
 from ._stack import stack
+from ._subtract import subtract
 from ._sum import sum
 from ._tanh import tanh
 from ._unstack import unstack
\ No newline at end of file
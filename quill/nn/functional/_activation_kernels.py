@@ -0,0 +1,58 @@
+from types import ModuleType
+from typing import Union
+import numpy
+from numpy import ndarray
+
+from ...core import available_backends, get_array_module
+
+# single-pass CuPy kernels, the NumPy fallbacks below reuse their buffers through `out=` instead
+if "cupy" in available_backends():
+    from cupy import ElementwiseKernel
+    _sigmoid_kernel = ElementwiseKernel("T x", "T y", "T e = exp(-fabs(x)); y = (x >= 0 ? 1 : e) / (1 + e)", "quill_sigmoid")
+    _sigmoid_grad_kernel = ElementwiseKernel("T y, T grad", "T x_grad", "x_grad += y * (1 - y) * grad", "quill_sigmoid_grad")
+    _tanh_grad_kernel = ElementwiseKernel("T y, T grad", "T x_grad", "x_grad += (1 - y * y) * grad", "quill_tanh_grad")
+    _relu_grad_kernel = ElementwiseKernel("T y, T grad", "T x_grad", "x_grad += y > 0 ? grad : (T)0", "quill_relu_grad")
+
+def sigmoid(x: ndarray, out: Union[ndarray, None] = None) -> ndarray:
+    xp: ModuleType = get_array_module(x)
+    if xp is not numpy:
+        return _sigmoid_kernel(x, out) if out is not None else _sigmoid_kernel(x)
+
+    # e^(-|x|) never overflows, sigmoid(x) = 1 / (1 + e^(-|x|)) for x >= 0 and e^(-|x|) / (1 + e^(-|x|)) otherwise
+    e: ndarray = xp.abs(x)
+    xp.negative(e, out=e)
+    xp.exp(e, out=e)
+    numerator: ndarray = xp.where(x >= 0, 1., e)
+    xp.add(e, 1., out=e)
+    return xp.divide(numerator, e, out=out if out is not None else numerator)
+
+def sigmoid_grad(y: ndarray, grad: ndarray, x_grad: ndarray) -> None:
+    if get_array_module(y) is not numpy:
+        _sigmoid_grad_kernel(y, grad, x_grad)
+        return
+    _grad: ndarray = 1. - y
+    _grad *= y
+    _grad *= grad
+    x_grad += _grad
+
+def tanh(x: ndarray, out: Union[ndarray, None] = None) -> ndarray:
+    return get_array_module(x).tanh(x, out=out)
+
+def tanh_grad(y: ndarray, grad: ndarray, x_grad: ndarray) -> None:
+    if get_array_module(y) is not numpy:
+        _tanh_grad_kernel(y, grad, x_grad)
+        return
+    _grad: ndarray = y * y
+    numpy.subtract(1., _grad, out=_grad)
+    _grad *= grad
+    x_grad += _grad
+
+def relu(x: ndarray, out: Union[ndarray, None] = None) -> ndarray:
+    return get_array_module(x).maximum(x, 0, out=out)
+
+def relu_grad(y: ndarray, grad: ndarray, x_grad: ndarray) -> None:
+    if get_array_module(y) is not numpy:
+        _relu_grad_kernel(y, grad, x_grad)
+        return
+    _grad: ndarray = y > 0
+    x_grad += grad * _grad
\ No newline at end of file
@@ -0,0 +1,53 @@
+from types import ModuleType
+from typing import Sequence, Tuple, Union
+from numpy import ndarray
+
+from ._avgpool3d import avgpool3d
+from ...core import Tensor
+from ...internals import expr_check, len_check, op_checks_enabled, type_check
+
+def adaptive_avgpool3d(input_tensor: Tensor, output_size: Union[int, Sequence[int]]) -> Tensor:
+
+    # TYPE CHECKS
+    if op_checks_enabled():
+        type_check(input_tensor, "input_tensor", Tensor)
+        type_check(output_size, "output_size", (int, Sequence), int)
+
+    # cast output_size into tuple
+    if isinstance(output_size, int):
+        output_size = (output_size, output_size)
+
+    # MISMATCHED DIMENSION CHECKS
+    if (input_tensor.nd.ndim != 3) and (input_tensor.nd.ndim != 4):
+        raise IndexError(f"Input tensor is {input_tensor.nd.ndim}-dimensional instead of 3-or-4-dimensional.")
+    len_check(output_size, "output_size", 2)
+
+    # VALUE OUT OF RANGE CHECKS
+    if op_checks_enabled():
+        for i_output_size in range(len(output_size)):
+            expr_check(output_size[i_output_size], f"output_size[{i_output_size}]", lambda x: x > 0)
+
+    # evenly divisible inputs are plain strided average pooling
+    d_input: Union[Tuple[int, int, int], Tuple[int, int, int, int]] = input_tensor.nd.shape
+    if (d_input[-2] % output_size[-2] == 0) and (d_input[-1] % output_size[-1] == 0):
+        kernel_size: Tuple[int, int] = (d_input[-2] // output_size[-2], d_input[-1] // output_size[-1])
+        return avgpool3d(input_tensor, kernel_size, kernel_size)
+
+    # otherwise window i spans [floor(i * n_input / n_output), ceil((i + 1) * n_input / n_output)), which is separable into two averaging matrices
+    xp: ModuleType = input_tensor.xp
+
+    def _pooling_matrix(n_input: int, n_output: int) -> ndarray:
+        i_output: ndarray = xp.arange(n_output)
+        start: ndarray = (i_output * n_input) // n_output
+        end: ndarray = -((-(i_output + 1) * n_input) // n_output)
+        i_input: ndarray = xp.arange(n_input)
+        mask: ndarray = (i_input >= start[:, None]) & (i_input < end[:, None])
+        return mask / (end - start)[:, None]
+
+    pooling_height: ndarray = _pooling_matrix(d_input[-2], output_size[-2])
+    pooling_width: ndarray = _pooling_matrix(d_input[-1], output_size[-1])
+
+    def grad_fn(child: Tensor) -> None:
+        input_tensor.accumulate_grad(pooling_height.T @ child.grad @ pooling_width)
+
+    return Tensor(pooling_height @ input_tensor.nd @ pooling_width.T, [input_tensor], grad_fn=grad_fn)
\ No newline at end of file
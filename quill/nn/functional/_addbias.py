@@ -1,23 +1,26 @@
-from typing import List
-from cupy import sum
+from numpy import ndarray
 
+from ._broadcast import accumulate_broadcast_grad, reduce_to_shape
 from ...core import Tensor
-from ...internals import type_check
+from ...internals import op_checks_enabled, type_check
 
 def addbias(x: Tensor, b: Tensor, axis: int = -1) -> Tensor:
     
     # TYPE CHECKS
     # both x and b must be Tensors
-    type_check(x, "x", Tensor)
-    type_check(b, "b", Tensor)
+    # axis must be an int
+    if op_checks_enabled():
+        type_check(x, "x", Tensor)
+        type_check(b, "b", Tensor)
+        type_check(axis, "axis", int)
+
+    # b is laid along axis and broadcast over the other axes of x, its gradient is reduced back in one sum
+    _axis: int = axis % x.nd.ndim
+    _b: ndarray = b.nd.reshape(tuple(-1 if i_dim == _axis else 1 for i_dim in range(x.nd.ndim)))
 
     def grad_fn(child: Tensor) -> None:
-        axes: List[int] = list(range(x.grad.ndim))
-        axes.pop(axis)
-        x.grad += child.grad
-        if len(axes) == 0:
-            b.grad += child.grad
-        else:
-            b.grad += sum(child.grad, axis=axes)
+        accumulate_broadcast_grad(x, child.grad)
+        if b.requires_grad:
+            b.accumulate_grad(reduce_to_shape(child.grad, _b.shape).reshape(b.nd.shape))
     
-    return Tensor(x.nd + b.nd[(..., *(None for _ in range(~axis))) if axis < 0 else (*(None for _ in range(axis)), ...)], [x, b], grad_fn=grad_fn)
\ No newline at end of file
+    return Tensor(x.nd + _b, [x, b], grad_fn=grad_fn)
\ No newline at end of file
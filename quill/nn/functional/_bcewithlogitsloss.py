@@ -0,0 +1,39 @@
+from numpy import ndarray
+
+from ._activation_kernels import sigmoid
+from ._reduction import check_reduction, loss_grad_scale, reduce_loss
+from ...core import Tensor
+from ...internals import op_checks_enabled, type_check
+
+def bcewithlogitsloss(x: Tensor, target: Tensor, reduction: str = "mean") -> Tensor:
+
+    # TYPE CHECKS
+    # both x and target must be Tensors
+    # reduction must be a str
+    if op_checks_enabled():
+        type_check(x, "x", Tensor)
+        type_check(target, "target", Tensor)
+        type_check(reduction, "reduction", str)
+
+    # VALUE OUT OF RANGE CHECKS
+    check_reduction(reduction)
+
+    # fused sigmoid and binary cross-entropy: max(x, 0) - x * target + log(1 + e^(-|x|)) never overflows
+    loss: ndarray = x.xp.abs(x.nd)
+    x.xp.negative(loss, out=loss)
+    x.xp.exp(loss, out=loss)
+    x.xp.log1p(loss, out=loss)
+    loss += x.xp.maximum(x.nd, 0)
+    loss -= x.nd * target.nd
+
+    def grad_fn(child: Tensor) -> None:
+        scale: ndarray = loss_grad_scale(child.grad, loss.size, reduction)
+        if x.requires_grad:
+            _grad: ndarray = sigmoid(x.nd)
+            _grad -= target.nd
+            _grad *= scale
+            x.accumulate_grad(_grad)
+        if target.requires_grad:
+            target.accumulate_grad(-x.nd * scale)
+
+    return Tensor(reduce_loss(loss, reduction), [x, target], grad_fn=grad_fn)
\ No newline at end of file
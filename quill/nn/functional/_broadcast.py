@@ -0,0 +1,20 @@
+from typing import Sequence, Tuple
+from numpy import ndarray
+
+from ...core import Tensor
+
+# binary elementwise ops (add, subtract, multiply, divide, power, maximum) compute their result with numpy broadcasting,
+# each backward then reduces the full-size gradient back to the shape of every operand through these helpers
+
+def reduce_to_shape(grad: ndarray, shape: Sequence[int]) -> ndarray:
+
+    # a broadcast operand receives the gradient summed over every axis it was broadcast along: the leading axes it lacks and its size-1 axes
+    n_leading: int = grad.ndim - len(shape)
+    axes: Tuple[int, ...] = (*range(n_leading), *(n_leading + i_dim for i_dim, dim in enumerate(shape) if (dim == 1) and (grad.shape[n_leading + i_dim] != 1)))
+    if len(axes) == 0:
+        return grad
+    return grad.sum(axis=axes, keepdims=True).reshape(shape)
+
+def accumulate_broadcast_grad(x: Tensor, grad: ndarray) -> None:
+    if x.requires_grad:
+        x.accumulate_grad(reduce_to_shape(grad, x.nd.shape))
\ No newline at end of file
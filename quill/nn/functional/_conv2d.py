@@ -0,0 +1,87 @@
+from types import ModuleType
+from typing import List, Sequence, Tuple, Union
+from numpy import ndarray
+
+from ._sliding_window import fold, sliding_window
+from ...core import Tensor, get_array_module
+from ...internals import expr_check, len_check, op_checks_enabled, type_check
+
+def conv2d(input_tensor: Tensor, weight: Tensor, bias: Union[Tensor, None] = None, stride: Union[int, Sequence[int]] = 1, padding: Union[int, Sequence[int]] = 0) -> Tensor:
+
+    # TYPE CHECKS
+    if op_checks_enabled():
+        type_check(input_tensor, "input_tensor", Tensor)
+        type_check(weight, "weight", Tensor)
+        type_check(bias, "bias", (Tensor, type(None)))
+        type_check(stride, "stride", (int, Sequence), int)
+        type_check(padding, "padding", (int, Sequence), int)
+
+    # cast stride and padding into tuple
+    if isinstance(stride, int):
+        stride = (stride, stride)
+    if isinstance(padding, int):
+        padding = (padding, padding)
+
+    # get ndarrays
+    input_nd: ndarray = input_tensor.nd
+    weight_nd: ndarray = weight.nd
+
+    # MISMATCHED DIMENSION CHECKS
+    if (input_nd.ndim != 3) and (input_nd.ndim != 4):
+        raise IndexError(f"Input tensor is {input_nd.ndim}-dimensional instead of 3-or-4-dimensional.")
+    if weight_nd.ndim != 4:
+        raise IndexError(f"Weight is {weight_nd.ndim}-dimensional instead of 4-dimensional.")
+    if input_nd.shape[-3] != weight_nd.shape[-3]:
+        raise IndexError(f"Input tensor with size {input_nd.shape} cannot be convolved with weight of size {weight_nd.shape}.")
+    if (bias is not None) and (bias.nd.shape != weight_nd.shape[:1]):
+        raise IndexError(f"Bias with size {bias.nd.shape} does not match weight of size {weight_nd.shape}.")
+    len_check(stride, "stride", 2)
+    len_check(padding, "padding", 2)
+
+    # VALUE OUT OF RANGE CHECKS
+    if op_checks_enabled():
+        for i_stride in range(len(stride)):
+            expr_check(stride[i_stride], f"stride[{i_stride}]", lambda x: x > 0)
+        for i_padding in range(len(padding)):
+            expr_check(padding[i_padding], f"padding[{i_padding}]", lambda x: x >= 0)
+
+    # get array module shared by input tensor and weight
+    xp: ModuleType = get_array_module(input_nd, weight_nd)
+
+    # pad input image
+    padded_nd: ndarray = input_nd
+    if (padding[-2] != 0) or (padding[-1] != 0):
+        padded_nd = xp.pad(input_nd, (*((0, 0) for _ in range(input_nd.ndim - 2)), (padding[-2], padding[-2]), (padding[-1], padding[-1])))
+
+    # im2col: (..., input_channels, output_height, output_width, kernel_height, kernel_width) window view over the padded input
+    windows: ndarray = sliding_window(padded_nd, weight_nd.shape[-2:], stride)
+    n_batch: int = windows.ndim - 5
+    batch_axes: Tuple[int, ...] = tuple(range(n_batch))
+
+    # all output channels in a single GEMM: (..., H, W, C*kh*kw) @ (C*kh*kw, O), then channels are moved in front of the image axes
+    output_nd: ndarray = xp.tensordot(windows, weight_nd, axes=((n_batch, n_batch + 3, n_batch + 4), (1, 2, 3)))
+    output_nd = xp.ascontiguousarray(xp.moveaxis(output_nd, -1, -3))
+    if bias is not None:
+        output_nd += bias.nd[:, None, None]
+
+    def grad_fn(child: Tensor) -> None:
+        grad: ndarray = child.grad
+
+        # calculate gradient for input image (grad @ weight, col2im, then strip padding)
+        if input_tensor.requires_grad:
+            grad_windows: ndarray = xp.moveaxis(xp.tensordot(grad, weight_nd, axes=((n_batch,), (0,))), -3, -5)
+            _grad: ndarray = fold(grad_windows, padded_nd.shape, stride)
+            input_tensor.accumulate_grad(_grad[..., padding[-2]:(padding[-2] + input_nd.shape[-2]), padding[-1]:(padding[-1] + input_nd.shape[-1])])
+
+        # calculate gradient for weight (grad^T @ cols, contracted over the batch and image axes)
+        if weight.requires_grad:
+            weight.accumulate_grad(xp.tensordot(grad, windows, axes=((*batch_axes, n_batch + 1, n_batch + 2), (*batch_axes, n_batch + 1, n_batch + 2))))
+
+        # calculate gradient for bias
+        if (bias is not None) and bias.requires_grad:
+            bias.accumulate_grad(grad.sum(axis=(*batch_axes, n_batch + 1, n_batch + 2)))
+
+    parents: List[Tensor] = [input_tensor, weight]
+    if bias is not None:
+        parents.append(bias)
+    return Tensor(output_nd, parents, grad_fn=grad_fn)
\ No newline at end of file
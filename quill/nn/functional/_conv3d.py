@@ -1,17 +1,19 @@
+from types import ModuleType
 from typing import Sequence, Tuple, Union
-from cupy import flip, pad, sum, zeros
 from numpy import ndarray
 
-from ...core import Tensor
-from ...internals import expr_check, len_check, type_check
+from ._sliding_window import sliding_window
+from ...core import Tensor, get_array_module
+from ...internals import expr_check, len_check, op_checks_enabled, type_check
 
 def conv3d(input_tensor: Tensor, kernel: Tensor, stride: Union[int, Sequence[int]] = 1, padding: Union[int, Sequence[int]] = 0) -> Tensor:
     
     # TYPE CHECKS
-    type_check(input_tensor, "input_tensor", Tensor)
-    type_check(kernel, "kernel", Tensor)
-    type_check(stride, "stride", (int, Sequence), int)
-    type_check(padding, "padding", (int, Sequence), int)
+    if op_checks_enabled():
+        type_check(input_tensor, "input_tensor", Tensor)
+        type_check(kernel, "kernel", Tensor)
+        type_check(stride, "stride", (int, Sequence), int)
+        type_check(padding, "padding", (int, Sequence), int)
 
     # cast stride, padding, and dilation into tuple
     if isinstance(stride, int):
@@ -34,74 +36,47 @@ def conv3d(input_tensor: Tensor, kernel: Tensor, stride: Union[int, Sequence[int
     len_check(padding, "padding", 2)
 
     # VALUE OUT OF RANGE CHECKS
-    for i_stride in range(len(stride)):
-        expr_check(stride[i_stride], f"stride[{i_stride}]", lambda x: x > 0)
-    for i_padding in range(len(padding)):
-        expr_check(padding[i_padding], f"padding[{i_padding}]", lambda x: x >= 0)
+    if op_checks_enabled():
+        for i_stride in range(len(stride)):
+            expr_check(stride[i_stride], f"stride[{i_stride}]", lambda x: x > 0)
+        for i_padding in range(len(padding)):
+            expr_check(padding[i_padding], f"padding[{i_padding}]", lambda x: x >= 0)
 
-    # conv3d function that returns an ndarray instead of Tensor (if numpy has a 3D convolution function, we would've borrowed it instead)
-    def _conv3d(x1: ndarray, x2: ndarray, stride: Sequence[int], padding: Sequence[int]) -> ndarray:
+    # get array module shared by input tensor and kernel
+    xp: ModuleType = get_array_module(input_nd, kernel_nd)
 
-        # pad input image
-        for p in padding:
-            if p != 0:
-                if x1.ndim == 3:
-                    x1 = pad(x1, ((0, 0), (padding[-2], padding[-2]), (padding[-1], padding[-1])))
-                else:
-                    x1 = pad(x1, ((0, 0), (0, 0), (padding[-2], padding[-2]), (padding[-1], padding[-1])))
-                break
+    # pad input image
+    padded_nd: ndarray = input_nd
+    if (padding[-2] != 0) or (padding[-1] != 0):
+        padded_nd = xp.pad(input_nd, (*((0, 0) for _ in range(input_nd.ndim - 2)), (padding[-2], padding[-2]), (padding[-1], padding[-1])))
 
-        # get input and kernel dimensions
-        d_x1: Union[Tuple[int, int, int], Tuple[int, int, int, int]] = x1.shape
-        d_x2: Tuple[int, int, int] = x2.shape
-        
-        # create output image
-        y_height: int = ((d_x1[-2] - d_x2[-2]) // stride[-2]) + 1
-        y_width: int = ((d_x1[-1] - d_x2[-1]) // stride[-1]) + 1
-        y: ndarray = zeros((*d_x1[:-2], y_height, y_width))
-
-        # 3D cross-correlation loop
-        for i_y, i_x1 in zip(range(y_height), range(0, (d_x1[-2] - d_x2[-2] + 1), stride[-2])):
-            for j_y, j_x1 in zip(range(y_width), range(0, (d_x1[-1] - d_x2[-1] + 1), stride[-1])):
-                y[..., i_y, j_y] = sum(x1[..., i_x1:(i_x1 + d_x2[-2]), j_x1:(j_x1 + d_x2[-1])] * x2, axis=(-1, -2))
-                
-        return y
+    # im2col: (..., channels, output_height, output_width, kernel_height, kernel_width) window view over the padded input
+    d_kernel: Tuple[int, int, int] = kernel_nd.shape
+    windows: ndarray = sliding_window(padded_nd, d_kernel[-2:], stride)
+    d_windows: Tuple[int, ...] = windows.shape
+    n_pixels: int = d_windows[-4] * d_windows[-3]
+    n_kernel: int = d_kernel[-2] * d_kernel[-1]
+    
+    # 3D cross-correlation as a single batched matmul per channel: (..., C, H*W, kh*kw) @ (C, kh*kw, 1)
+    cols: ndarray = windows.reshape((*d_windows[:-4], n_pixels, n_kernel))
+    output_nd: ndarray = (cols @ kernel_nd.reshape((d_kernel[-3], n_kernel, 1))).reshape(d_windows[:-2])
+    del cols
 
-    # dilation function, only used by grad_fn
-    def _dilate(x: ndarray, dilation: Tuple[int, int]) -> ndarray:
-        d_x: Union[Tuple[int, int, int], Tuple[int, int, int, int]] = x.shape
-        y_height: int = d_x[-2] + ((d_x[-2] - 1) * (dilation[-2] - 1))
-        y_width: int = d_x[-1] + ((d_x[-1] - 1) * (dilation[-1] - 1))
-        y: ndarray = zeros((*d_x[:-2], y_height, y_width))
-        for i_x, i_y in zip(range(d_x[-2]), range(0, y_height, dilation[-2])):
-            for j_x, j_y in zip(range(d_x[-1]), range(0, y_width, dilation[-1])):
-                y[..., i_y, j_y] = x[..., i_x, j_x]
-        return y
-            
     def grad_fn(child: Tensor) -> None:
+        grad: ndarray = child.grad.reshape((*d_windows[:-4], n_pixels, 1))
 
-        # dilate grad according to stride
-        grad: ndarray = _dilate(child.grad, stride)
-
-        # calculate 'outer padding' (pad for pixels that were not convoluted in forward pass)
-        d_input: Union[Tuple[int, int, int], Tuple[int, int, int, int]] = input_nd.shape
-        d_kernel: Tuple[int, int, int] = kernel_nd.shape
-        outer_padding_height: int = (d_input[-2] + 2 * padding[-2] - d_kernel[-2]) % stride[-2]
-        outer_padding_width: int = (d_input[-1] + 2 * padding[-1] - d_kernel[-1]) % stride[-1]
-        
-        # calculate gradient for input image
-        _grad: ndarray = _conv3d(grad, flip(kernel_nd, axis=(-1, -2)), (1, 1), (d_kernel[-2] - 1, d_kernel[-1] - 1))
-        if _grad.ndim == 3:
-            _grad = pad(_grad, ((0, 0), (0, outer_padding_height), (0, outer_padding_width)))
-        else:
-            _grad = pad(_grad, ((0, 0), (0, 0), (0, outer_padding_height), (0, outer_padding_width)))
-        input_tensor.grad += _grad[..., padding[-2]:(padding[-2] + d_input[-2]), padding[-1]:(padding[-1] + d_input[-1])]
+        # calculate gradient for input image (col2im fused with the kernel product: one strided multiply-add per kernel element, then strip padding)
+        if input_tensor.requires_grad:
+            _grad: ndarray = xp.zeros(padded_nd.shape, dtype=child.grad.dtype)
+            for i_kernel in range(d_kernel[-2]):
+                for j_kernel in range(d_kernel[-1]):
+                    _grad[..., i_kernel:(i_kernel + (d_windows[-4] - 1) * stride[-2] + 1):stride[-2], j_kernel:(j_kernel + (d_windows[-3] - 1) * stride[-1] + 1):stride[-1]] += child.grad * kernel_nd[:, i_kernel, j_kernel, None, None]
+            input_tensor.accumulate_grad(_grad[..., padding[-2]:(padding[-2] + input_nd.shape[-2]), padding[-1]:(padding[-1] + input_nd.shape[-1])])
 
-        # calculate gradient for kernel
-        d_grad: Union[Tuple[int, int, int], Tuple[int, int, int, int]] = grad.shape
-        _grad: ndarray = _conv3d(input_nd.reshape((-1, d_input[-2], d_input[-1])), grad.reshape((-1, d_grad[-2], d_grad[-1])), (1, 1), padding)[:, :d_kernel[-2], :d_kernel[-1]]
-        n_channel: int = kernel.grad.shape[-3]
-        for i_channel in range(n_channel):
-            kernel.grad[i_channel, :, :] += sum(_grad[i_channel::n_channel, :, :], axis=0)
+        # calculate gradient for kernel (grad^T @ cols, summed over the batch)
+        if kernel.requires_grad:
+            cols: ndarray = windows.reshape((*d_windows[:-4], n_pixels, n_kernel))
+            _grad = (xp.swapaxes(grad, -1, -2) @ cols).reshape((*d_windows[:-5], *d_kernel))
+            kernel.accumulate_grad(_grad.sum(axis=tuple(range(_grad.ndim - 3))))
 
-    return Tensor(_conv3d(input_nd, kernel_nd, stride, padding), [input_tensor, kernel], grad_fn=grad_fn)
\ No newline at end of file
+    return Tensor(output_nd, [input_tensor, kernel], grad_fn=grad_fn)
\ No newline at end of file
@@ -0,0 +1,64 @@
+from types import ModuleType
+from typing import Tuple
+import numpy
+from numpy import ndarray
+
+from ._reduction import check_reduction, loss_grad_scale, reduce_loss
+from ...core import Tensor
+from ...internals import op_checks_enabled, type_check
+
+def crossentropyloss(x: Tensor, target: Tensor, axis: int = -1, reduction: str = "mean") -> Tensor:
+
+    # TYPE CHECKS
+    # both x and target must be Tensors
+    # axis must be an int
+    # reduction must be a str
+    if op_checks_enabled():
+        type_check(x, "x", Tensor)
+        type_check(target, "target", Tensor)
+        type_check(axis, "axis", int)
+        type_check(reduction, "reduction", str)
+
+    # VALUE OUT OF RANGE CHECKS
+    check_reduction(reduction)
+
+    # target holds integer class indices (x without the class axis) or class probabilities (same shape as x)
+    xp: ModuleType = x.xp
+    _axis: int = axis % x.nd.ndim
+    indices: bool = numpy.issubdtype(target.nd.dtype, numpy.integer)
+
+    # MISMATCHED DIMENSION CHECKS
+    if op_checks_enabled():
+        expected_shape: Tuple[int, ...] = (*x.nd.shape[:_axis], *x.nd.shape[(_axis + 1):]) if indices else x.nd.shape
+        if target.nd.shape != expected_shape:
+            raise IndexError(f"`target` must be of shape `{expected_shape}`, it cannot be of shape `{target.nd.shape}`.")
+
+    # fused log-softmax: log p = x - max - log(sum(exp(x - max))), the log-probabilities are kept for backward
+    log_probs: ndarray = x.nd - x.nd.max(axis=_axis, keepdims=True)
+    log_probs -= xp.log(xp.exp(log_probs).sum(axis=_axis, keepdims=True))
+    if indices:
+        target_indices: ndarray = xp.expand_dims(target.nd, _axis)
+        loss: ndarray = -xp.take_along_axis(log_probs, target_indices, _axis).squeeze(_axis)
+    else:
+        loss = -(target.nd * log_probs).sum(axis=_axis)
+
+    def grad_fn(child: Tensor) -> None:
+        scale: ndarray = loss_grad_scale(child.grad, loss.size, reduction)
+        if reduction == "none":
+            scale = xp.expand_dims(scale, _axis)
+
+        # d loss / d x = softmax(x) * sum(target) - target, one elementwise pass over the log-probabilities
+        if x.requires_grad:
+            _grad: ndarray = xp.exp(log_probs)
+            if indices:
+                classes: ndarray = xp.arange(x.nd.shape[_axis]).reshape(tuple(-1 if i_dim == _axis else 1 for i_dim in range(x.nd.ndim)))
+                _grad -= (target_indices == classes)
+            else:
+                _grad *= target.nd.sum(axis=_axis, keepdims=True)
+                _grad -= target.nd
+            _grad *= scale
+            x.accumulate_grad(_grad)
+        if (not indices) and target.requires_grad:
+            target.accumulate_grad(-log_probs * scale)
+
+    return Tensor(reduce_loss(loss, reduction), [x, target], grad_fn=grad_fn)
\ No newline at end of file
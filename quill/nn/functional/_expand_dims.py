@@ -1,17 +1,14 @@
-from cupy import expand_dims as _expand_dims, squeeze
-
 from ...core import Tensor
-from ...internals import type_check
+from ...internals import op_checks_enabled, type_check
 
 def expand_dims(x: Tensor, axis: int) -> Tensor:
 
     # TYPE CHECKS
     # x must be a Tensor
     # axis must be an int
-    type_check(x, "x", Tensor)
-    type_check(axis, "axis", int)
-
-    def grad_fn(child: Tensor) -> None:
-        x.grad += squeeze(child.grad, axis=axis)
+    if op_checks_enabled():
+        type_check(x, "x", Tensor)
+        type_check(axis, "axis", int)
 
-    return Tensor(_expand_dims(x.nd, axis), [x], grad_fn=grad_fn)
\ No newline at end of file
+    # the gradient is a view of the gradient of x, indexing with None inserts the new axis
+    return Tensor(x.xp.expand_dims(x.nd, axis), [x], grad_base=(x, (*(slice(None) for _ in range(axis % (x.nd.ndim + 1))), None)))
\ No newline at end of file
@@ -1,13 +1,14 @@
 from ...core import Tensor
-from ...internals import type_check
+from ...internals import op_checks_enabled, type_check
 
 def flatten(x: Tensor) -> Tensor:
 
     # TYPE CHECKS
     # x must be a Tensor
-    type_check(x, "x", Tensor)
+    if op_checks_enabled():
+        type_check(x, "x", Tensor)
 
     def grad_fn(child: Tensor) -> None:
-        x.grad += child.grad.reshape(x.grad.shape)
+        x.accumulate_grad(child.grad.reshape(x.nd.shape))
 
     return Tensor(x.nd.flatten(), [x], grad_fn=grad_fn)
\ No newline at end of file
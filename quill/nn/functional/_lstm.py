@@ -0,0 +1,92 @@
+from types import ModuleType
+from typing import List, Tuple, Union
+from numpy import ndarray
+
+from ._lstm_kernels import lstm_cell_backward, lstm_cell_forward
+from ._split import split
+from ...core import Tensor
+from ...internals import op_checks_enabled, type_check
+
+def lstm(x: Tensor, h: Tensor, c: Tensor, weight_ih: Tensor, weight_hh: Tensor, bias_ih: Union[Tensor, None] = None, bias_hh: Union[Tensor, None] = None) -> Tuple[Tensor, Tensor]:
+
+    # TYPE CHECKS
+    if op_checks_enabled():
+        type_check(x, "x", Tensor)
+        type_check(h, "h", Tensor)
+        type_check(c, "c", Tensor)
+        type_check(weight_ih, "weight_ih", Tensor)
+        type_check(weight_hh, "weight_hh", Tensor)
+        type_check(bias_ih, "bias_ih", (Tensor, type(None)))
+        type_check(bias_hh, "bias_hh", (Tensor, type(None)))
+
+    # get dimensions
+    input_size: int = weight_ih.nd.shape[0]
+    hidden_size: int = weight_hh.nd.shape[0]
+
+    # MISMATCHED DIMENSION CHECKS
+    if x.nd.ndim < 2:
+        raise IndexError(f"Input tensor is {x.nd.ndim}-dimensional instead of at least 2-dimensional.")
+    if weight_ih.nd.shape != (x.nd.shape[-1], 4 * hidden_size):
+        raise IndexError(f"Input with size {x.nd.shape} does not match input-hidden weight of size {weight_ih.nd.shape}.")
+    if weight_hh.nd.shape != (hidden_size, 4 * hidden_size):
+        raise IndexError(f"Hidden-hidden weight is of size {weight_hh.nd.shape} instead of ({hidden_size}, {4 * hidden_size}).")
+
+    xp: ModuleType = x.xp
+    n_steps: int = x.nd.shape[-2]
+
+    # input projection of the whole sequence in a single GEMM, overwritten with the gate activations step by step
+    gates: ndarray = x.nd @ weight_ih.nd
+    if bias_ih is not None:
+        gates += bias_ih.nd
+
+    # output holds h (first half) and c (second half) of every step, tanh(c) is cached for the backward pass
+    output_nd: ndarray = xp.empty((*gates.shape[:-1], 2 * hidden_size), dtype=gates.dtype)
+    tanh_c: ndarray = xp.empty((*gates.shape[:-1], hidden_size), dtype=gates.dtype)
+    h_nd: ndarray = h.nd
+    c_nd: ndarray = c.nd
+    for t in range(n_steps):
+        _gates: ndarray = gates[..., t, :]
+        _gates += h_nd @ weight_hh.nd
+        if bias_hh is not None:
+            _gates += bias_hh.nd
+        h_nd, c_nd, tanh_c[..., t, :] = lstm_cell_forward(_gates, c_nd)
+        output_nd[..., t, :hidden_size] = h_nd
+        output_nd[..., t, hidden_size:] = c_nd
+
+    def grad_fn(child: Tensor) -> None:
+
+        # backpropagation through time, only the recurrent GEMM stays inside the loop
+        z_grad: ndarray = xp.empty(gates.shape, dtype=gates.dtype)
+        h_grad: ndarray = xp.zeros(output_nd.shape[:-2] + (hidden_size,), dtype=gates.dtype)
+        c_grad: ndarray = xp.zeros(output_nd.shape[:-2] + (hidden_size,), dtype=gates.dtype)
+        for t in reversed(range(n_steps)):
+            h_grad += child.grad[..., t, :hidden_size]
+            c_grad += child.grad[..., t, hidden_size:]
+            _c: ndarray = c.nd if t == 0 else output_nd[..., t - 1, hidden_size:]
+            z_grad[..., t, :], c_grad = lstm_cell_backward(h_grad, c_grad, _c, gates[..., t, :], tanh_c[..., t, :])
+            h_grad = z_grad[..., t, :] @ weight_hh.nd.T
+        if h.requires_grad:
+            h.accumulate_grad(h_grad)
+        if c.requires_grad:
+            c.accumulate_grad(c_grad)
+
+        # input and weight gradients over the whole sequence
+        if x.requires_grad:
+            x.accumulate_grad(z_grad @ weight_ih.nd.T)
+        _h: ndarray = xp.concatenate((xp.broadcast_to(h.nd[..., None, :], (*output_nd.shape[:-2], 1, hidden_size)), output_nd[..., :-1, :hidden_size]), axis=-2)
+        z_grad = z_grad.reshape((-1, 4 * hidden_size))
+        if weight_ih.requires_grad:
+            weight_ih.accumulate_grad(x.nd.reshape((-1, input_size)).T @ z_grad)
+        if weight_hh.requires_grad:
+            weight_hh.accumulate_grad(_h.reshape((-1, hidden_size)).T @ z_grad)
+        if (bias_ih is not None) and bias_ih.requires_grad:
+            bias_ih.accumulate_grad(z_grad.sum(axis=0))
+        if (bias_hh is not None) and bias_hh.requires_grad:
+            bias_hh.accumulate_grad(z_grad.sum(axis=0))
+
+    # the h and c sequences are returned as the two halves of a single fused node
+    parents: List[Tensor] = [x, h, c, weight_ih, weight_hh]
+    parents.extend(bias for bias in (bias_ih, bias_hh) if bias is not None)
+    hc: Tensor = Tensor(output_nd, parents, grad_fn=grad_fn)
+    y, c_sequence = split(hc, 2, axis=-1)
+    return y, c_sequence
\ No newline at end of file
@@ -0,0 +1,62 @@
+from typing import List, Tuple, Union
+from numpy import ndarray
+
+from ._lstm_kernels import lstm_cell_backward, lstm_cell_forward
+from ._split import split
+from ...core import Tensor
+from ...internals import op_checks_enabled, type_check
+
+def lstm_cell(x: Tensor, h: Tensor, c: Tensor, weight_ih: Tensor, weight_hh: Tensor, bias_ih: Union[Tensor, None] = None, bias_hh: Union[Tensor, None] = None) -> Tuple[Tensor, Tensor]:
+
+    # TYPE CHECKS
+    if op_checks_enabled():
+        type_check(x, "x", Tensor)
+        type_check(h, "h", Tensor)
+        type_check(c, "c", Tensor)
+        type_check(weight_ih, "weight_ih", Tensor)
+        type_check(weight_hh, "weight_hh", Tensor)
+        type_check(bias_ih, "bias_ih", (Tensor, type(None)))
+        type_check(bias_hh, "bias_hh", (Tensor, type(None)))
+
+    # get dimensions
+    input_size: int = weight_ih.nd.shape[0]
+    hidden_size: int = weight_hh.nd.shape[0]
+
+    # MISMATCHED DIMENSION CHECKS
+    if weight_ih.nd.shape != (x.nd.shape[-1], 4 * hidden_size):
+        raise IndexError(f"Input with size {x.nd.shape} does not match input-hidden weight of size {weight_ih.nd.shape}.")
+    if weight_hh.nd.shape != (hidden_size, 4 * hidden_size):
+        raise IndexError(f"Hidden-hidden weight is of size {weight_hh.nd.shape} instead of ({hidden_size}, {4 * hidden_size}).")
+
+    # gate pre-activations, overwritten with the gate activations by lstm_cell_forward
+    gates: ndarray = (x.nd @ weight_ih.nd) + (h.nd @ weight_hh.nd)
+    if bias_ih is not None:
+        gates += bias_ih.nd
+    if bias_hh is not None:
+        gates += bias_hh.nd
+    h_nd, c_nd, tanh_c = lstm_cell_forward(gates, c.nd)
+
+    def grad_fn(child: Tensor) -> None:
+        z_grad, c_grad = lstm_cell_backward(child.grad[..., :hidden_size], child.grad[..., hidden_size:], c.nd, gates, tanh_c)
+        if x.requires_grad:
+            x.accumulate_grad(z_grad @ weight_ih.nd.T)
+        if h.requires_grad:
+            h.accumulate_grad(z_grad @ weight_hh.nd.T)
+        if c.requires_grad:
+            c.accumulate_grad(c_grad)
+        z_grad = z_grad.reshape((-1, 4 * hidden_size))
+        if weight_ih.requires_grad:
+            weight_ih.accumulate_grad(x.nd.reshape((-1, input_size)).T @ z_grad)
+        if weight_hh.requires_grad:
+            weight_hh.accumulate_grad(h.nd.reshape((-1, hidden_size)).T @ z_grad)
+        if (bias_ih is not None) and bias_ih.requires_grad:
+            bias_ih.accumulate_grad(z_grad.sum(axis=0))
+        if (bias_hh is not None) and bias_hh.requires_grad:
+            bias_hh.accumulate_grad(z_grad.sum(axis=0))
+
+    # h and c are returned as the two halves of a single fused node
+    parents: List[Tensor] = [x, h, c, weight_ih, weight_hh]
+    parents.extend(bias for bias in (bias_ih, bias_hh) if bias is not None)
+    hc: Tensor = Tensor(x.xp.concatenate((h_nd, c_nd), axis=-1), parents, grad_fn=grad_fn)
+    h_next, c_next = split(hc, 2, axis=-1)
+    return h_next, c_next
\ No newline at end of file
@@ -0,0 +1,44 @@
+from types import ModuleType
+from typing import Tuple
+from numpy import ndarray
+
+from ._activation_kernels import sigmoid, sigmoid_grad, tanh, tanh_grad
+from ...core import get_array_module
+
+def lstm_cell_forward(z: ndarray, c: ndarray) -> Tuple[ndarray, ndarray, ndarray]:
+
+    # z holds the pre-activations of the forget, input, cell and output gates, in that order, along the last axis
+    # the gate activations are written back into z, so it doubles as the cache for lstm_cell_backward
+    hidden_size: int = z.shape[-1] // 4
+    sigmoid(z[..., :(2 * hidden_size)], out=z[..., :(2 * hidden_size)])
+    tanh(z[..., (2 * hidden_size):(3 * hidden_size)], out=z[..., (2 * hidden_size):(3 * hidden_size)])
+    sigmoid(z[..., (3 * hidden_size):], out=z[..., (3 * hidden_size):])
+    f, i, c_tilde, o = z[..., :hidden_size], z[..., hidden_size:(2 * hidden_size)], z[..., (2 * hidden_size):(3 * hidden_size)], z[..., (3 * hidden_size):]
+
+    # c = f * c + i * c_tilde, h = o * tanh(c)
+    c_next: ndarray = f * c
+    c_next += i * c_tilde
+    tanh_c: ndarray = tanh(c_next)
+    h_next: ndarray = o * tanh_c
+    return h_next, c_next, tanh_c
+
+def lstm_cell_backward(h_grad: ndarray, c_grad: ndarray, c: ndarray, gates: ndarray, tanh_c: ndarray) -> Tuple[ndarray, ndarray]:
+
+    xp: ModuleType = get_array_module(gates)
+    hidden_size: int = gates.shape[-1] // 4
+    f, i, c_tilde, o = gates[..., :hidden_size], gates[..., hidden_size:(2 * hidden_size)], gates[..., (2 * hidden_size):(3 * hidden_size)], gates[..., (3 * hidden_size):]
+
+    # total gradient flowing into the new cell state (directly and through h = o * tanh(c))
+    _c_grad: ndarray = xp.array(c_grad, copy=True)
+    tanh_grad(tanh_c, h_grad * o, _c_grad)
+
+    # gradients of the gate pre-activations
+    z_grad: ndarray = xp.zeros(gates.shape, dtype=gates.dtype)
+    sigmoid_grad(f, _c_grad * c, z_grad[..., :hidden_size])
+    sigmoid_grad(i, _c_grad * c_tilde, z_grad[..., hidden_size:(2 * hidden_size)])
+    tanh_grad(c_tilde, _c_grad * i, z_grad[..., (2 * hidden_size):(3 * hidden_size)])
+    sigmoid_grad(o, h_grad * tanh_c, z_grad[..., (3 * hidden_size):])
+
+    # gradient of the previous cell state
+    _c_grad *= f
+    return z_grad, _c_grad
\ No newline at end of file
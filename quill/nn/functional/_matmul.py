@@ -1,29 +1,33 @@
 from numpy import ndarray
-from cupy import matmul as _matmul, sum, swapaxes
 
+from ._broadcast import reduce_to_shape
 from ...core import Tensor
-from ...internals import type_check
+from ...internals import op_checks_enabled, type_check
 
 def matmul(x1: Tensor, x2: Tensor) -> Tensor:
     
     # TYPE CHECKS
     # both x1 and x2 must be Tensors
-    type_check(x1, "x1", Tensor)
-    type_check(x2, "x2", Tensor)
+    if op_checks_enabled():
+        type_check(x1, "x1", Tensor)
+        type_check(x2, "x2", Tensor)
 
+    # the leading (batch) axes broadcast like in the elementwise ops, see _broadcast.py
     def grad_fn(child: Tensor) -> None:
-        _x1_grad: ndarray = _matmul(child.grad, swapaxes(x2.nd, -1, -2))
-        _x2_grad: ndarray = _matmul(swapaxes(x1.nd, -1, -2), child.grad)
-        x1_ndim: int = x1.nd.ndim
-        x2_ndim: int = x2.nd.ndim
-        if x1_ndim == x2_ndim:
-            x1.grad += _x1_grad
-            x2.grad += _x2_grad
-        elif x1_ndim < x2_ndim:
-            x1.grad += sum(_x1_grad, axis=tuple(range(x2_ndim - x1_ndim)))
-            x2.grad += _x2_grad
-        else:
-            x1.grad += _x1_grad
-            x2.grad += sum(_x2_grad, axis=tuple(range(x1_ndim - x2_ndim)))
 
-    return Tensor(_matmul(x1.nd, x2.nd), [x1, x2], grad_fn=grad_fn)
\ No newline at end of file
+        # 1-D operands are promoted like numpy does: a row vector on the left, a column vector on the right
+        _x1: ndarray = x1.nd if x1.nd.ndim > 1 else x1.nd[None, :]
+        _x2: ndarray = x2.nd if x2.nd.ndim > 1 else x2.nd[:, None]
+        _grad: ndarray = child.grad if x2.nd.ndim > 1 else child.grad[..., None]
+        _grad = _grad if x1.nd.ndim > 1 else _grad[..., None, :]
+        if x1.requires_grad:
+            x1.accumulate_grad(reduce_to_shape(_grad @ _x2.swapaxes(-1, -2), _x1.shape).reshape(x1.nd.shape))
+        if x2.requires_grad:
+            # a shared 2-D right operand (e.g. a weight) is reduced over the batch by a single matrix product
+            if (_x2.ndim == 2) and (_x1.ndim > 2):
+                _x2_grad: ndarray = _x1.reshape(-1, _x1.shape[-1]).T @ _grad.reshape(-1, _grad.shape[-1])
+            else:
+                _x2_grad = reduce_to_shape(_x1.swapaxes(-1, -2) @ _grad, _x2.shape)
+            x2.accumulate_grad(_x2_grad.reshape(x2.nd.shape))
+
+    return Tensor(x1.xp.asarray(x1.nd @ x2.nd), [x1, x2], grad_fn=grad_fn)
\ No newline at end of file
@@ -0,0 +1,23 @@
+from numpy import ndarray
+
+from ._broadcast import accumulate_broadcast_grad
+from ...core import Tensor
+from ...internals import op_checks_enabled, type_check
+
+def maximum(x1: Tensor, x2: Tensor) -> Tensor:
+    
+    # TYPE CHECKS
+    # both x1 and x2 must be Tensors
+    if op_checks_enabled():
+        type_check(x1, "x1", Tensor)
+        type_check(x2, "x2", Tensor)
+
+    def grad_fn(child: Tensor) -> None:
+        # ties send the gradient to x1
+        mask: ndarray = x1.nd >= x2.nd
+        if x1.requires_grad:
+            accumulate_broadcast_grad(x1, child.grad * mask)
+        if x2.requires_grad:
+            accumulate_broadcast_grad(x2, child.grad * ~mask)
+
+    return Tensor(x1.xp.asarray(x1.xp.maximum(x1.nd, x2.nd)), [x1, x2], grad_fn=grad_fn)
\ No newline at end of file
@@ -1,16 +1,18 @@
+from types import ModuleType
 from typing import Sequence, Tuple, Union
-from cupy import amax, argmax, unravel_index, zeros
 from numpy import ndarray
 
-from ...core import Tensor
-from ...internals import expr_check, len_check, type_check
+from ._sliding_window import sliding_window
+from ...core import Tensor, get_array_module, is_grad_enabled
+from ...internals import expr_check, len_check, op_checks_enabled, type_check
 
 def maxpool3d(input_tensor: Tensor, kernel_size: Union[int, Sequence[int]], stride: Union[int, Sequence[int], None] = None) -> Tensor:
 
     # TYPE CHECKS
-    type_check(input_tensor, "input_tensor", Tensor)
-    type_check(kernel_size, "kernel_size", (int, Sequence), int)
-    type_check(stride, "stride", (int, Sequence, type(None)), int)
+    if op_checks_enabled():
+        type_check(input_tensor, "input_tensor", Tensor)
+        type_check(kernel_size, "kernel_size", (int, Sequence), int)
+        type_check(stride, "stride", (int, Sequence, type(None)), int)
     
     # cast kernel_size and stride into tuple
     if isinstance(kernel_size, int):
@@ -27,46 +29,41 @@ def maxpool3d(input_tensor: Tensor, kernel_size: Union[int, Sequence[int]], stri
     len_check(stride, "stride", 2)
 
     # VALUE OUT OF RANGE CHECKS
-    for i_kernel_size in range(len(kernel_size)):
-        expr_check(kernel_size[i_kernel_size], f"kernel_size[{i_kernel_size}]", lambda x: x > 0)
-    for i_stride in range(len(stride)):
-        expr_check(stride[i_stride], f"stride[{i_stride}]", lambda x: x > 0)
+    if op_checks_enabled():
+        for i_kernel_size in range(len(kernel_size)):
+            expr_check(kernel_size[i_kernel_size], f"kernel_size[{i_kernel_size}]", lambda x: x > 0)
+        for i_stride in range(len(stride)):
+            expr_check(stride[i_stride], f"stride[{i_stride}]", lambda x: x > 0)
     
-    def _maxpool3d(input_nd: ndarray, kernel_size: Sequence[int], stride: Sequence[int]) -> ndarray:
+    # get array module and dimensions of input tensor
+    xp: ModuleType = get_array_module(input_tensor.nd)
+    d_input: Union[Tuple[int, int, int], Tuple[int, int, int, int]] = input_tensor.nd.shape
 
-        # get input dimensions
-        d_input_nd: Union[Tuple[int, int, int], Tuple[int, int, int, int]] = input_nd.shape
+    # window view of shape (..., output_height, output_width, kernel_height * kernel_width)
+    windows: ndarray = sliding_window(input_tensor.nd, kernel_size, stride)
+    d_windows: Tuple[int, ...] = windows.shape
+    windows = windows.reshape((*d_windows[:-2], kernel_size[-2] * kernel_size[-1]))
 
-        # create output image
-        output_nd_height: int = ((d_input_nd[-2] - kernel_size[-2]) // stride[-2]) + 1
-        output_nd_width: int = ((d_input_nd[-1] - kernel_size[-1]) // stride[-1]) + 1
-        output_nd: ndarray = zeros((*d_input_nd[:-2], output_nd_height, output_nd_width))
+    # without grad mode only the window maxima are needed
+    if not is_grad_enabled():
+        return Tensor(windows.max(axis=-1), [input_tensor])
 
-        # 3D max pooling loop
-        for i_output_nd, i_input_nd in zip(range(output_nd_height), range(0, (d_input_nd[-2] - kernel_size[-2] + 1), stride[-2])):
-            for j_output_nd, j_input_nd in zip(range(output_nd_width), range(0, (d_input_nd[-1] - kernel_size[-1] + 1), stride[-1])):
-                _input_nd: ndarray = input_tensor.nd[..., i_input_nd:(i_input_nd + kernel_size[-2]), j_input_nd:(j_input_nd + kernel_size[-1])]
-                output_nd[..., i_output_nd, j_output_nd] = amax(_input_nd, axis=(-1, -2))
-        
-        return output_nd
+    # window maxima and the argmax of every window (first occurrence on ties)
+    argmax_nd: ndarray = xp.argmax(windows, axis=-1)
+    output_nd: ndarray = xp.take_along_axis(windows, argmax_nd[..., None], axis=-1)[..., 0]
+    del windows
+
+    # cache argmax as flat indices into the input tensor
+    i_output: ndarray = xp.arange(d_windows[-4]).reshape((-1, 1))
+    j_output: ndarray = xp.arange(d_windows[-3]).reshape((1, -1))
+    i_input: ndarray = (i_output * stride[-2]) + (argmax_nd // kernel_size[-1])
+    j_input: ndarray = (j_output * stride[-1]) + (argmax_nd % kernel_size[-1])
+    offset: ndarray = xp.arange(0, input_tensor.nd.size, d_input[-2] * d_input[-1]).reshape((*d_input[:-2], 1, 1))
+    argmax_nd = (offset + (i_input * d_input[-1]) + j_input).ravel()
+    del i_input, j_input
 
     def grad_fn(child: Tensor) -> None:
-        d_input: Union[Tuple[int, int, int], Tuple[int, int, int, int]] = input_tensor.nd.shape
-        d_child_grad: Union[Tuple[int, int, int], Tuple[int, int, int, int]] = child.grad.shape
-        if input_tensor.grad.ndim == 3:
-            for input_nd_matrix, input_grad_matrix, child_grad_matrix in zip(input_tensor.nd, input_tensor.grad, child.grad):
-                for i_child_grad, i_input in zip(range(d_child_grad[-2]), range(0, (d_input[-2] - kernel_size[-2] + 1), stride[-2])):
-                    for j_child_grad, j_input in zip(range(d_child_grad[-1]), range(0, (d_input[-1] - kernel_size[-1] + 1), stride[-1])):
-                        _input_nd_matrix: ndarray = input_nd_matrix[i_input:(i_input + kernel_size[-2]), j_input:(j_input + kernel_size[-1])]
-                        _input_grad_matrix: ndarray = input_grad_matrix[i_input:(i_input + kernel_size[-2]), j_input:(j_input + kernel_size[-1])]
-                        _input_grad_matrix[unravel_index(argmax(_input_nd_matrix), _input_nd_matrix.shape)] += child_grad_matrix[i_child_grad, j_child_grad]
-        else:
-            for input_nd_matrices, input_grad_matrices, child_grad_matrices in zip(input_tensor.nd, input_tensor.grad, child.grad):
-                for input_nd_matrix, input_grad_matrix, child_grad_matrix in zip(input_nd_matrices, input_grad_matrices, child_grad_matrices):
-                    for i_child_grad, i_input in zip(range(d_child_grad[-2]), range(0, (d_input[-2] - kernel_size[-2] + 1), stride[-2])):
-                        for j_child_grad, j_input in zip(range(d_child_grad[-1]), range(0, (d_input[-1] - kernel_size[-1] + 1), stride[-1])):
-                            _input_nd_matrix: ndarray = input_nd_matrix[i_input:(i_input + kernel_size[-2]), j_input:(j_input + kernel_size[-1])]
-                            _input_grad_matrix: ndarray = input_grad_matrix[i_input:(i_input + kernel_size[-2]), j_input:(j_input + kernel_size[-1])]
-                            _input_grad_matrix[unravel_index(argmax(_input_nd_matrix), _input_nd_matrix.shape)] += child_grad_matrix[i_child_grad, j_child_grad]
+        # scatter-add of child grad into the argmax positions (overlapping windows accumulate)
+        input_tensor.accumulate_grad(xp.bincount(argmax_nd, weights=child.grad.ravel(), minlength=input_tensor.nd.size).reshape(d_input))
 
-    return Tensor(_maxpool3d(input_tensor.nd, kernel_size, stride), [input_tensor], grad_fn=grad_fn)
\ No newline at end of file
+    return Tensor(output_nd, [input_tensor], grad_fn=grad_fn)
\ No newline at end of file
@@ -0,0 +1,26 @@
+from typing import Sequence, Tuple, Union
+
+from ._reduction import kept_shape, normalize_axes
+from ...core import Tensor
+from ...internals import op_checks_enabled, type_check
+
+def mean(x: Tensor, axis: Union[int, Sequence[int], None] = 0, keepdims: bool = False) -> Tensor:
+
+    # TYPE CHECKS
+    # x must be a Tensor
+    # axis must be an int, a sequence of ints or None
+    # keepdims must be a bool
+    if op_checks_enabled():
+        type_check(x, "x", Tensor)
+        type_check(axis, "axis", (int, Sequence, type(None)), int)
+        type_check(keepdims, "keepdims", bool)
+
+    _axis: Tuple[int, ...] = normalize_axes(axis, x.nd.ndim)
+    count: int = 1
+    for i_axis in _axis:
+        count *= x.nd.shape[i_axis]
+
+    def grad_fn(child: Tensor) -> None:
+        x.accumulate_grad(x.xp.broadcast_to(child.grad.reshape(kept_shape(x.nd.shape, _axis)) / count, x.nd.shape))
+
+    return Tensor(x.xp.asarray(x.nd.mean(axis=_axis, keepdims=keepdims)), [x], grad_fn=grad_fn)
\ No newline at end of file
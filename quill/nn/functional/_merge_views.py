@@ -0,0 +1,32 @@
+from typing import Sequence, Tuple, Union
+
+from ...core import Tensor
+
+def merge_views(tensors: Sequence[Tensor], axis: int, stacked: bool) -> Union[Tuple[Tensor, Tuple[Union[int, slice, None], ...]], None]:
+
+    # tensors must all be views of one base, taken along the same axis
+    if (len(tensors) == 0) or any(tensor.grad_base is None for tensor in tensors):
+        return None
+    base: Tensor = tensors[0].grad_base[0]
+    if any(tensor.grad_base[0] is not base for tensor in tensors):
+        return None
+    prefix: Tuple[slice, ...] = tuple(slice(None) for _ in range(axis))
+
+    # consecutive unstack indices (stacked) or split sections (concatenated) merge into one slice of the base
+    start: Union[int, None] = None
+    stop: Union[int, None] = None
+    for tensor in tensors:
+        index: Tuple[Union[int, slice, None], ...] = tensor.grad_base[1]
+        if (len(index) != axis + 1) or (index[:axis] != prefix):
+            return None
+        if stacked and isinstance(index[-1], int) and not isinstance(index[-1], bool):
+            lower, upper = index[-1], index[-1] + 1
+        elif (not stacked) and isinstance(index[-1], slice) and (index[-1].step is None):
+            lower, upper = index[-1].start, index[-1].stop
+        else:
+            return None
+        if (start is not None) and (lower != stop):
+            return None
+        start = lower if start is None else start
+        stop = upper
+    return base, (*prefix, slice(start, stop))
\ No newline at end of file
@@ -1,9 +1,30 @@
+from numpy import ndarray
+
+from ._reduction import check_reduction, loss_grad_scale, reduce_loss
 from ...core import Tensor
+from ...internals import op_checks_enabled, type_check
+
+def mseloss(y_tilde: Tensor, y: Tensor, reduction: str = "mean") -> Tensor:
+
+    # TYPE CHECKS
+    # both y_tilde and y must be Tensors
+    # reduction must be a str
+    if op_checks_enabled():
+        type_check(y_tilde, "y_tilde", Tensor)
+        type_check(y, "y", Tensor)
+        type_check(reduction, "reduction", str)
+
+    # VALUE OUT OF RANGE CHECKS
+    check_reduction(reduction)
 
-def mseloss(y_tilde: Tensor, y: Tensor):
+    # the difference is kept for backward, the squared loss is reduced straight away
+    diff: ndarray = y_tilde.nd - y.nd
 
     def grad_fn(child: Tensor) -> None:
-        y_tilde.grad += (y_tilde.nd - y.nd) * child.grad
-        y.grad += (y.nd - y_tilde.nd) * child.grad
+        scale: ndarray = loss_grad_scale(child.grad, diff.size, reduction)
+        if y_tilde.requires_grad:
+            y_tilde.accumulate_grad(diff * scale)
+        if y.requires_grad:
+            y.accumulate_grad(-diff * scale)
     
-    return Tensor(((y_tilde.nd - y.nd) ** 2) * 0.5, [y_tilde, y], grad_fn=grad_fn)
\ No newline at end of file
+    return Tensor(reduce_loss((diff ** 2) * 0.5, reduction), [y_tilde, y], grad_fn=grad_fn)
\ No newline at end of file
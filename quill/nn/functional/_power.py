@@ -0,0 +1,20 @@
+from ._broadcast import accumulate_broadcast_grad
+from ...core import Tensor
+from ...internals import op_checks_enabled, type_check
+
+def power(x1: Tensor, x2: Tensor) -> Tensor:
+    
+    # TYPE CHECKS
+    # both x1 and x2 must be Tensors
+    if op_checks_enabled():
+        type_check(x1, "x1", Tensor)
+        type_check(x2, "x2", Tensor)
+
+    def grad_fn(child: Tensor) -> None:
+        if x1.requires_grad:
+            accumulate_broadcast_grad(x1, child.grad * x2.nd * (x1.nd ** (x2.nd - 1)))
+        if x2.requires_grad:
+            # d(x1 ** x2) / d x2 = x1 ** x2 * log(x1) is only real for x1 > 0, elsewhere it is taken to be 0
+            accumulate_broadcast_grad(x2, child.grad * (x1.nd ** x2.nd) * x1.xp.log(x1.xp.where(x1.nd > 0, x1.nd, 1)))
+
+    return Tensor(x1.xp.asarray(x1.nd ** x2.nd), [x1, x2], grad_fn=grad_fn)
\ No newline at end of file
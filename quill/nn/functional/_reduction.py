@@ -0,0 +1,38 @@
+from types import ModuleType
+from typing import Sequence, Tuple, Union
+from numpy import ndarray
+
+from ...core import get_array_module
+
+# reductions accepted by the loss functions
+REDUCTIONS: Tuple[str, ...] = ("none", "mean", "sum")
+
+def normalize_axes(axis: Union[int, Sequence[int], None], ndim: int) -> Tuple[int, ...]:
+    if axis is None:
+        return tuple(range(ndim))
+    if isinstance(axis, int):
+        return (axis % ndim,)
+    return tuple(sorted(set(_axis % ndim for _axis in axis)))
+
+def kept_shape(shape: Sequence[int], axes: Tuple[int, ...]) -> Tuple[int, ...]:
+    # the shape of the reduced array with keepdims=True, which broadcasts against the original shape
+    return tuple(1 if i_dim in axes else dim for i_dim, dim in enumerate(shape))
+
+def check_reduction(reduction: str) -> None:
+    # runs at every validation level: an unknown reduction would otherwise fall through to the unreduced loss and silently change the loss scale
+    if reduction not in REDUCTIONS:
+        raise ValueError(f"`reduction` must be one of these reductions: `{REDUCTIONS}`, it cannot be `{reduction}`.")
+
+def reduce_loss(loss: ndarray, reduction: str) -> ndarray:
+    xp: ModuleType = get_array_module(loss)
+    if reduction == "mean":
+        return xp.asarray(loss.mean())
+    if reduction == "sum":
+        return xp.asarray(loss.sum())
+    return loss
+
+def loss_grad_scale(grad: ndarray, size: int, reduction: str) -> ndarray:
+    # the gradient of every element of the un-reduced loss, a 0-d array for mean/sum that broadcasts in the fused backward
+    if reduction == "mean":
+        return grad / size
+    return grad
\ No newline at end of file
@@ -1,15 +1,21 @@
-from cupy import maximum
+from ._activation_kernels import relu as _relu, relu_grad
+from ...core import Tensor, is_grad_enabled
+from ...internals import op_checks_enabled, type_check
 
-from ...core import Tensor
-from ...internals import type_check
-
-def relu(x: Tensor) -> Tensor:
+def relu(x: Tensor, inplace: bool = False) -> Tensor:
 
     # TYPE CHECKS
     # x must be a Tensor
-    type_check(x, "x", Tensor)
+    # inplace must be a bool
+    if op_checks_enabled():
+        type_check(x, "x", Tensor)
+        type_check(inplace, "inplace", bool)
+
+    # writing into x would corrupt the values the graph behind x still needs for its backward (and leaf or view data), so in-place only runs without a graph
+    if inplace and x.requires_grad and is_grad_enabled():
+        raise ValueError("`inplace` cannot be True while `x` requires grad, in-place activations are only allowed under no_grad or on tensors that do not require grad.")
 
     def grad_fn(child: Tensor) -> None:
-        x.grad[x.nd > 0] += child.grad[x.nd > 0]
+        relu_grad(child.nd, child.grad, x.ensure_grad())
 
-    return Tensor(maximum(x.nd, 0), [x], grad_fn=grad_fn)
\ No newline at end of file
+    return Tensor(_relu(x.nd, out=x.nd if inplace else None), [x], grad_fn=grad_fn)
\ No newline at end of file
@@ -1,17 +1,18 @@
 from typing import Sequence
 
 from ...core import Tensor
-from ...internals import type_check
+from ...internals import op_checks_enabled, type_check
 
 def reshape(x: Tensor, newshape: Sequence[int]) -> Tensor:
 
     # TYPE CHECKS
     # x must be a Tensor
     # newshape must be a sequence of ints
-    type_check(x, "x", Tensor)
-    type_check(newshape, "newshape", Sequence, int)
+    if op_checks_enabled():
+        type_check(x, "x", Tensor)
+        type_check(newshape, "newshape", Sequence, int)
 
     def grad_fn(child: Tensor) -> None:
-        x.grad += child.grad.reshape(x.grad.shape)
+        x.accumulate_grad(child.grad.reshape(x.nd.shape))
 
     return Tensor(x.nd.reshape(newshape), [x], grad_fn=grad_fn)
\ No newline at end of file
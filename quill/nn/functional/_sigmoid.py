@@ -1,24 +1,20 @@
-from cupy import apply_along_axis, exp
+from ._activation_kernels import sigmoid as _sigmoid, sigmoid_grad
+from ...core import Tensor, is_grad_enabled
+from ...internals import op_checks_enabled, type_check
 
-from ...core import Tensor
-from ...internals import type_check
-
-def sigmoid(x: Tensor) -> Tensor:
+def sigmoid(x: Tensor, inplace: bool = False) -> Tensor:
 
     # TYPE CHECKS
     # x must be a Tensor
-    type_check(x, "x", Tensor)
+    # inplace must be a bool
+    if op_checks_enabled():
+        type_check(x, "x", Tensor)
+        type_check(inplace, "inplace", bool)
 
-    def _sigmoid(x: float) -> float:
-        if x >= 0:
-            y: float = exp(-x)
-            y = 1 / (1 + y)
-        else:
-            y: float = exp(x)
-            y = y / (1 + y)
-        return y
+    if inplace and x.requires_grad and is_grad_enabled():
+        raise ValueError("`inplace` cannot be True while `x` requires grad, in-place activations are only allowed under no_grad or on tensors that do not require grad.")
 
     def grad_fn(child: Tensor) -> None:
-        x.grad += (child.nd * (1 - child.nd)) * child.grad
+        sigmoid_grad(child.nd, child.grad, x.ensure_grad())
 
-    return Tensor(apply_along_axis(_sigmoid, -1, x.nd.reshape(-1, 1)).reshape(x.nd.shape), [x], grad_fn=grad_fn)
\ No newline at end of file
+    return Tensor(_sigmoid(x.nd, out=x.nd if inplace else None), [x], grad_fn=grad_fn)
\ No newline at end of file
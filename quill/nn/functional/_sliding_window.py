@@ -0,0 +1,31 @@
+from types import ModuleType
+from typing import Sequence, Tuple
+from numpy import ndarray
+
+from ...core import get_array_module
+
+def sliding_window(nd: ndarray, kernel_size: Sequence[int], stride: Sequence[int]) -> ndarray:
+
+    # get input dimensions and strides
+    d_nd: Tuple[int, ...] = nd.shape
+    s_nd: Tuple[int, ...] = nd.strides
+
+    # window view of shape (..., output_height, output_width, kernel_height, kernel_width), no data is copied
+    output_height: int = ((d_nd[-2] - kernel_size[-2]) // stride[-2]) + 1
+    output_width: int = ((d_nd[-1] - kernel_size[-1]) // stride[-1]) + 1
+    xp: ModuleType = get_array_module(nd)
+    return xp.lib.stride_tricks.as_strided(nd, shape=(*d_nd[:-2], output_height, output_width, kernel_size[-2], kernel_size[-1]), strides=(*s_nd[:-2], s_nd[-2] * stride[-2], s_nd[-1] * stride[-1], s_nd[-2], s_nd[-1]))
+
+def fold(windows: ndarray, shape: Sequence[int], stride: Sequence[int]) -> ndarray:
+
+    # get window dimensions
+    d_windows: Tuple[int, ...] = windows.shape
+    output_height, output_width, kernel_height, kernel_width = d_windows[-4:]
+
+    # col2im: accumulate windows back into an image of the given shape, one strided slice per kernel element
+    xp: ModuleType = get_array_module(windows)
+    y: ndarray = xp.zeros((*d_windows[:-4], shape[-2], shape[-1]), dtype=windows.dtype)
+    for i_kernel in range(kernel_height):
+        for j_kernel in range(kernel_width):
+            y[..., i_kernel:(i_kernel + (output_height - 1) * stride[-2] + 1):stride[-2], j_kernel:(j_kernel + (output_width - 1) * stride[-1] + 1):stride[-1]] += windows[..., i_kernel, j_kernel]
+    return y
\ No newline at end of file
@@ -1,23 +1,27 @@
-from typing import List
-from cupy import split as _split
+from typing import List, Sequence, Tuple, Union
+from numpy import ndarray
 
 from ...core import Tensor
-from ...internals import type_check
+from ...internals import op_checks_enabled, type_check
 
-def split(tensor: Tensor, indices_or_sections: int, axis: int = 0) -> List[Tensor]:
+def split(tensor: Tensor, indices_or_sections: Union[int, Sequence[int]], axis: int = 0) -> List[Tensor]:
 
     # TYPE CHECKS
     # tensor must be a Tensor
+    # indices_or_sections must be an int or a sequence of ints
     # axis must be an int
-    type_check(tensor, "tensor", Tensor)
-    type_check(axis, "axis", int)
+    if op_checks_enabled():
+        type_check(tensor, "tensor", Tensor)
+        type_check(indices_or_sections, "indices_or_sections", (int, Sequence), int)
+        type_check(axis, "axis", int)
 
-    def grad_fn(child: Tensor) -> None:
-        stride: int = tensor.nd.shape[axis] // indices_or_sections
-        if axis < 0:
-            _axis: int = ~axis
-            tensor.grad[(*(slice(None) for _ in range(child.grad.ndim - _axis - 1)), slice(child.split_idx, child.split_idx + stride), *(slice(None) for _ in range(_axis)))] += child.grad
-        else:
-            tensor.grad[(*(slice(None) for _ in range(axis)), slice(child.split_idx, child.split_idx + stride), *(slice(None) for _ in range(child.grad.ndim - axis - 1)))] += child.grad
-
-    return [Tensor(nd, [tensor], grad_fn=grad_fn, split_idx=i_nd) for i_nd, nd in enumerate(_split(tensor.nd, indices_or_sections, axis))]
\ No newline at end of file
+    # sections are views of tensor, their gradients are views of the gradient of tensor, so backward needs no scatter at all
+    nds: List[ndarray] = tensor.xp.split(tensor.nd, indices_or_sections, axis)
+    _axis: int = axis % tensor.nd.ndim
+    tensors: List[Tensor] = []
+    offset: int = 0
+    for nd in nds:
+        index: Tuple[slice, ...] = (*(slice(None) for _ in range(_axis)), slice(offset, offset + nd.shape[_axis]))
+        tensors.append(Tensor(nd, [tensor], grad_base=(tensor, index)))
+        offset += nd.shape[_axis]
+    return tensors
\ No newline at end of file
@@ -1,17 +1,14 @@
-from cupy import expand_dims, squeeze as _squeeze
-
 from ...core import Tensor
-from ...internals import type_check
+from ...internals import op_checks_enabled, type_check
 
 def squeeze(x: Tensor, axis: int) -> Tensor:
 
     # TYPE CHECKS
     # x must be a Tensor
     # axis must be an int
-    type_check(x, "x", Tensor)
-    type_check(axis, "axis", int)
-
-    def grad_fn(child: Tensor) -> None:
-        x.grad += expand_dims(child.grad, axis)
+    if op_checks_enabled():
+        type_check(x, "x", Tensor)
+        type_check(axis, "axis", int)
 
-    return Tensor(_squeeze(x.nd, axis=axis), [x], grad_fn=grad_fn)
\ No newline at end of file
+    # the gradient is a view of the gradient of x, indexing the squeezed axis with 0 drops it
+    return Tensor(x.nd.squeeze(axis=axis), [x], grad_base=(x, (*(slice(None) for _ in range(axis % x.nd.ndim)), 0)))
\ No newline at end of file
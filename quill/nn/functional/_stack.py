@@ -1,21 +1,30 @@
-from typing import List, Sequence
-from cupy import split, squeeze, stack as _stack
+from typing import Sequence, Tuple, Union
 from numpy import ndarray
 
-from ...core import Tensor
-from ...internals import type_check
+from ...core import Tensor, get_array_module
+from ...internals import op_checks_enabled, type_check
+from ._merge_views import merge_views
 
 def stack(tensors: Sequence[Tensor], axis: int = 0) -> Tensor:
 
     # TYPE CHECKS
     # tensors must be a sequence of Tensors
     # axis must be an int
-    type_check(tensors, "tensors", Sequence, Tensor)
-    type_check(axis, "axis", int)
+    if op_checks_enabled():
+        type_check(tensors, "tensors", Sequence, Tensor)
+        type_check(axis, "axis", int)
+
+    # re-joining consecutive views of one base (e.g. the output of unstack) is itself a view of the base: no copy, and the gradient accumulates into the base as one block
+    merged: Union[Tuple[Tensor, Tuple[Union[int, slice, None], ...]], None] = merge_views(tensors, axis % (tensors[0].nd.ndim + 1), True) if len(tensors) > 0 else None
+    if merged is not None:
+        base, index = merged
+        return Tensor(base.nd[index], [base], grad_base=(base, index))
 
     def grad_fn(child: Tensor) -> None:
-        _child_grad: List[ndarray] = [squeeze(_grad, axis) for _grad in split(child.grad, child.grad.shape[axis], axis)]
+        # one view per stacked tensor, no split or squeeze copies
+        _child_grad: ndarray = child.xp.moveaxis(child.grad, axis, 0)
         for i_tensor in range(len(tensors)):
-            tensors[i_tensor].grad += _child_grad[i_tensor]
+            if tensors[i_tensor].requires_grad:
+                tensors[i_tensor].accumulate_grad(_child_grad[i_tensor])
 
-    return Tensor(_stack([tensor.nd for tensor in tensors], axis), [tensor for tensor in tensors], grad_fn=grad_fn)
\ No newline at end of file
+    return Tensor(get_array_module(*(tensor.nd for tensor in tensors)).stack([tensor.nd for tensor in tensors], axis), [tensor for tensor in tensors], grad_fn=grad_fn)
\ No newline at end of file
@@ -1,17 +1,24 @@
-from cupy import expand_dims, sum as _sum, repeat
+from typing import Sequence, Tuple, Union
 
+from ._reduction import kept_shape, normalize_axes
 from ...core import Tensor
-from ...internals import type_check
+from ...internals import op_checks_enabled, type_check
 
-def sum(x: Tensor, axis: int = 0) -> Tensor:
+def sum(x: Tensor, axis: Union[int, Sequence[int], None] = 0, keepdims: bool = False) -> Tensor:
     
     # TYPE CHECKS
     # x must be a Tensor
-    # axis must be an int
-    type_check(x, "x", Tensor)
-    type_check(axis, "axis", int)
+    # axis must be an int, a sequence of ints or None
+    # keepdims must be a bool
+    if op_checks_enabled():
+        type_check(x, "x", Tensor)
+        type_check(axis, "axis", (int, Sequence, type(None)), int)
+        type_check(keepdims, "keepdims", bool)
+
+    _axis: Tuple[int, ...] = normalize_axes(axis, x.nd.ndim)
 
     def grad_fn(child: Tensor) -> None:
-        x.grad += repeat(expand_dims(child.grad, axis), x.grad.shape[axis], axis)
+        # the reduced gradient is broadcast back over the summed axes, no repeated copy is materialized
+        x.accumulate_grad(x.xp.broadcast_to(child.grad.reshape(kept_shape(x.nd.shape, _axis)), x.nd.shape))
 
-    return Tensor((_sum(x.nd, axis=axis)), [x], grad_fn=grad_fn)
\ No newline at end of file
+    return Tensor(x.xp.asarray(x.nd.sum(axis=_axis, keepdims=keepdims)), [x], grad_fn=grad_fn)
\ No newline at end of file
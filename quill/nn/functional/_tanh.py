@@ -1,21 +1,20 @@
-from cupy import exp
-from numpy import ndarray
+from ._activation_kernels import tanh as _tanh, tanh_grad
+from ...core import Tensor, is_grad_enabled
+from ...internals import op_checks_enabled, type_check
 
-from ...core import Tensor
-from ...internals import type_check
-
-def tanh(x: Tensor) -> Tensor:
+def tanh(x: Tensor, inplace: bool = False) -> Tensor:
 
     # TYPE CHECKS
     # x must be a Tensor
-    type_check(x, "x", Tensor)
+    # inplace must be a bool
+    if op_checks_enabled():
+        type_check(x, "x", Tensor)
+        type_check(inplace, "inplace", bool)
 
-    def _tanh(x: ndarray) -> ndarray:
-        y1: ndarray = exp(x)
-        y2: ndarray = exp(-x)
-        return (y1 - y2) / (y1 + y2)
+    if inplace and x.requires_grad and is_grad_enabled():
+        raise ValueError("`inplace` cannot be True while `x` requires grad, in-place activations are only allowed under no_grad or on tensors that do not require grad.")
 
     def grad_fn(child: Tensor) -> None:
-        x.grad += (1 - (child.nd ** 2)) * child.grad
+        tanh_grad(child.nd, child.grad, x.ensure_grad())
 
-    return Tensor(_tanh(x.nd), [x], grad_fn=grad_fn)
\ No newline at end of file
+    return Tensor(_tanh(x.nd, out=x.nd if inplace else None), [x], grad_fn=grad_fn)
\ No newline at end of file
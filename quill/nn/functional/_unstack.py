@@ -1,20 +1,19 @@
-from typing import List
-from cupy import split, squeeze
+from typing import List, Tuple, Union
 
 from ...core import Tensor
-from ...internals import type_check
+from ...internals import op_checks_enabled, type_check
 
 def unstack(tensor: Tensor, axis: int = 0) -> List[Tensor]:
 
     # TYPE CHECKS
     # tensor must be a Tensor
-    type_check(tensor, "tensor", Tensor)
+    if op_checks_enabled():
+        type_check(tensor, "tensor", Tensor)
 
-    def grad_fn(child: Tensor) -> None:
-        if axis < 0:
-            _axis: int = ~axis
-            tensor.grad[(*(slice(None) for _ in range(child.grad.ndim - _axis - 1)), child.split_idx, *(slice(None) for _ in range(_axis)))] += child.grad
-        else:
-            tensor.grad[(*(slice(None) for _ in range(axis)), child.split_idx, *(slice(None) for _ in range(child.grad.ndim - axis - 1)))] += child.grad
-
-    return [Tensor(squeeze(nd, axis=axis), [tensor], grad_fn=grad_fn, split_idx=i_nd) for i_nd, nd in enumerate(split(tensor.nd, tensor.nd.shape[axis], axis))]
\ No newline at end of file
+    # slices are views of tensor, their gradients are views of the gradient of tensor, so backward needs no scatter at all
+    _axis: int = axis % tensor.nd.ndim
+    tensors: List[Tensor] = []
+    for i_nd in range(tensor.nd.shape[_axis]):
+        index: Tuple[Union[slice, int], ...] = (*(slice(None) for _ in range(_axis)), i_nd)
+        tensors.append(Tensor(tensor.nd[index], [tensor], grad_base=(tensor, index)))
+    return tensors
\ No newline at end of file
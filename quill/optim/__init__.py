@@ -1,3 +1,6 @@
 from ._optimizer import Optimizer
 
-from ._sgd import SGD
\ No newline at end of file
+from ._sgd import SGD
+from ._adam import Adam
+from ._adamw import AdamW
+from ._rmsprop import RMSProp
\ No newline at end of file
@@ -0,0 +1,38 @@
+from typing import Dict, List, Tuple, Union
+from numpy import ndarray
+
+from . import Optimizer
+from ._optimizer_kernels import adam_update
+from ..core import Tensor
+from ..internals import expr_check, len_check, type_check
+
+_State = Union[Tensor, Dict[str, "_State"]]
+
+class Adam(Optimizer):
+
+    state_names: Tuple[str, ...] = ("exp_avg", "exp_avg_sq")
+
+    def __init__(self, params: Union[Dict[str, _State], List[Tensor]], lr: float = 0.001, betas: Tuple[float, float] = (0.9, 0.999), eps: float = 1e-8, contiguous: bool = False, foreach: bool = False):
+        super().__init__(params, contiguous, foreach)
+
+        # TYPE CHECKS
+        type_check(lr, "lr", (int, float))
+        type_check(betas, "betas", (tuple, list), (int, float))
+        type_check(eps, "eps", (int, float))
+
+        # MISMATCHED DIMENSION CHECKS
+        len_check(betas, "betas", 2)
+
+        # VALUE OUT OF RANGE CHECKS
+        expr_check(lr, "lr", lambda x: x > 0)
+        expr_check(betas[0], "betas[0]", lambda x: 0 <= x < 1)
+        expr_check(betas[1], "betas[1]", lambda x: 0 <= x < 1)
+        expr_check(eps, "eps", lambda x: x > 0)
+
+        self.lr: float = lr
+        self.betas: Tuple[float, float] = tuple(betas)
+        self.eps: float = eps
+        self.weight_decay: float = 0.
+
+    def update(self, param: ndarray, grad: ndarray, *state: ndarray) -> None:
+        adam_update(param, grad, state[0], state[1], self.lr, self.betas[0], self.betas[1], self.eps, self.weight_decay, self.step_count, self.scratch(param))
\ No newline at end of file
@@ -0,0 +1,21 @@
+from typing import Dict, List, Tuple, Union
+
+from . import Adam
+from ..core import Tensor
+from ..internals import expr_check, type_check
+
+_State = Union[Tensor, Dict[str, "_State"]]
+
+class AdamW(Adam):
+
+    def __init__(self, params: Union[Dict[str, _State], List[Tensor]], lr: float = 0.001, betas: Tuple[float, float] = (0.9, 0.999), eps: float = 1e-8, weight_decay: float = 0.01, contiguous: bool = False, foreach: bool = False):
+        super().__init__(params, lr, betas, eps, contiguous, foreach)
+
+        # TYPE CHECKS
+        type_check(weight_decay, "weight_decay", (int, float))
+
+        # VALUE OUT OF RANGE CHECKS
+        expr_check(weight_decay, "weight_decay", lambda x: x >= 0)
+
+        # decoupled weight decay, the parameters shrink by lr * weight_decay before the Adam step
+        self.weight_decay = weight_decay
\ No newline at end of file
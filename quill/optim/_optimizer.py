@@ -1,49 +1,176 @@
-from typing import Callable, Dict, List, Union
-from cupy import zeros
+from types import ModuleType
+from typing import Callable, Dict, List, Tuple, Union
+from numpy import ndarray
 
-from ..core import Tensor
+from ..core import Tensor, flatten_parameters, get_array_module
+from ..internals import type_check
 
 _State = Union[Tensor, Dict[str, "_State"]]
 
 class Optimizer:
 
-    def __init__(self, params: Dict[str, _State]) -> None:
-        self.params: Dict[str, _State] = params
-    
-    def _modify_params(self, expr: Callable[[Tensor], None]) -> None:
-        values: List[_State] = list(self.params.values())
-        visited: List[_State] = []
-        while len(values) > 0:
-            v: _State = values.pop(0)
-            if v not in visited:
-                if isinstance(v, dict):
-                    values.extend(list(v.values()))
+    # names of the per-parameter state buffers passed to `update`, in order
+    state_names: Tuple[str, ...] = ()
+
+    def __init__(self, params: Union[Dict[str, _State], List[Tensor]], contiguous: bool = False, foreach: bool = False) -> None:
+
+        # TYPE CHECKS
+        type_check(params, "params", (dict, list))
+        type_check(contiguous, "contiguous", bool)
+        type_check(foreach, "foreach", bool)
+
+        self.params: Union[Dict[str, _State], List[Tensor]] = params
+        self.contiguous: bool = contiguous
+        self.foreach: bool = foreach
+
+        # the nested state is flattened once, every zero_grad and step walks this list
+        # frozen parameters stay in it: which ones are updated is decided by requires_grad at step time, so layers can be frozen and unfrozen later
+        self.flat_params: List[Tensor] = flatten_parameters(params)
+
+        # leaves default to requires_grad=False, an optimizer over constants would silently never step
+        if not any(x.requires_grad for x in self.flat_params):
+            raise ValueError("Optimizer needs at least one parameter that requires grad, create parameters with `requires_grad=True`.")
+        self._flat: Union[Tensor, None] = None
+        self._views: List[Tuple[Tensor, ndarray, ndarray]] = []
+        if contiguous:
+            self._flat, self._views = self._pack(self.flat_params)
+
+        # optimizer state lives in flat per-optimizer buffers, each parameter owns the slice starting at its offset (the same layout as the packed buffers)
+        self._offsets: Dict[int, int] = {}
+        self._size: int = 0
+        for x in self.flat_params:
+            self._offsets[id(x)] = self._size
+            self._size += x.nd.size
+        self._state: Dict[str, ndarray] = {}
+
+        # a tensor whose grad was None on some steps was not updated on them, so every tensor counts its own steps (e.g. for bias correction), exposed to `update` as step_count
+        self._steps: Dict[int, int] = {}
+        self.step_count: int = 0
+        self._buffers: Dict[str, ndarray] = {}
+        self._scratch: Union[ndarray, None] = None
+
+    @staticmethod
+    def _pack(params: List[Tensor]) -> Tuple[Tensor, List[Tuple[Tensor, ndarray, ndarray]]]:
+        xp: ModuleType = params[0].xp
+        data: ndarray = xp.empty(sum(x.nd.size for x in params), dtype=xp.result_type(*(x.nd for x in params)))
+        grad: ndarray = xp.zeros(data.shape, dtype=data.dtype)
+
+        # every parameter and its grad become views into the two flat buffers
+        views: List[Tuple[Tensor, ndarray, ndarray]] = []
+        offset: int = 0
+        for x in params:
+            size: int = x.nd.size
+            data[offset:(offset + size)] = x.nd.ravel()
+            x.nd = data[offset:(offset + size)].reshape(x.nd.shape)
+            x.grad = grad[offset:(offset + size)].reshape(x.nd.shape)
+            views.append((x, x.nd, x.grad))
+            offset += size
+        flat: Tensor = Tensor(data, requires_grad=True)
+        flat.grad = grad
+        return flat, views
+
+    def _rebind(self) -> None:
+
+        # anything that replaces a packed parameter's nd or grad (Module.set_requires_grad, Tensor.to, assigning grad) unlinks it from the flat buffers, its values are copied back and the views re-attached
+        for x, data, grad in self._views:
+            if x.nd is not data:
+                if (get_array_module(x.nd) is not get_array_module(data)) or (x.nd.shape != data.shape):
+                    raise ValueError("Packed parameter was moved to another backend or reshaped after the contiguous optimizer was created, create the optimizer after moving the model.")
+                data[...] = x.nd
+                x.nd = data
+            if x.grad is not grad:
+                if x.grad is None:
+                    grad.fill(0)
                 else:
-                    expr(v)
-                visited.append(v)
-    
+                    grad[...] = x.grad
+                x.grad = grad
+
+    def _buffer(self, buffers: Dict[str, ndarray], name: str) -> ndarray:
+        if name not in buffers:
+            xp: ModuleType = self.flat_params[0].xp
+            buffers[name] = xp.zeros(self._size, dtype=xp.result_type(*(x.nd for x in self.flat_params)))
+        return buffers[name]
+
+    def state(self, name: str, x: Tensor) -> ndarray:
+        offset: int = self._offsets[id(x)]
+        return self._buffer(self._state, name)[offset:(offset + x.nd.size)].reshape(x.nd.shape)
+
+    def scratch(self, nd: ndarray) -> ndarray:
+        # one flat buffer, grown to the largest update, stands in for the per-step temporaries of every update
+        size: int = nd.size
+        if (self._scratch is None) or (self._scratch.size < size) or (self._scratch.dtype != nd.dtype) or (get_array_module(self._scratch) is not get_array_module(nd)):
+            self._scratch = get_array_module(nd).empty(max(size, 0 if self._scratch is None else self._scratch.size), dtype=nd.dtype)
+        return self._scratch[:size].reshape(nd.shape)
+
+    def _modify_params(self, expr: Callable[[Tensor], None]) -> None:
+        for x in self.flat_params:
+            expr(x)
+
     def reset_velocity(self) -> None:
-        def _reset_velocity(x: Tensor) -> None:
-            if self in x.velocities:
-                del x.velocities[self]
-        self._modify_params(_reset_velocity)
-    
+        # optimizer state lives in this optimizer only, resetting drops it together with the step count
+        self._state.clear()
+        self._steps.clear()
+
     def clear_velocities(self) -> None:
-        def _clear_velocities(x: Tensor) -> None:
-            x.velocities.clear()
-        self._modify_params(_clear_velocities)
-    
-    def zero_grad(self) -> None:
+        self.reset_velocity()
+
+    def zero_grad(self, set_to_none: bool = True) -> None:
+        type_check(set_to_none, "set_to_none", bool)
+
+        # packed grads are always zeroed in place so the per-parameter views stay bound to the flat buffer
+        if self._flat is not None:
+            self._rebind()
+            self._flat.grad.fill(0)
+            return
         def _zero_grad(x: Tensor) -> None:
-            x.i_backward = 0
-            x.grad = zeros(x.grad.shape)
+            if set_to_none:
+                x.grad = None
+            elif x.grad is not None:
+                x.grad.fill(0)
         self._modify_params(_zero_grad)
-    
+
+    def update(self, param: ndarray, grad: ndarray, *state: ndarray) -> None:
+        raise NotImplementedError(f"Update function for {type(self).__name__} optimizer has not been implemented yet.")
+
     def step_fn(self, x: Tensor) -> None:
-        raise NotImplementedError(f"Step function for {type(self).__name__} optimizer has not been implemented yet.")
-    
+        self._steps[id(x)] = self._steps.get(id(x), 0) + 1
+        self.step_count = self._steps[id(x)]
+        self.update(x.nd, x.grad, *(self.state(name, x) for name in self.state_names))
+
+    def _fused_step(self, tensors: List[Tensor]) -> None:
+        for x in tensors:
+            self._steps[id(x)] = self._steps.get(id(x), 0) + 1
+        self.step_count = self._steps[id(tensors[0])]
+
+        # packed parameters already are one flat buffer, the update runs on it directly
+        if self._flat is not None:
+            self.update(self._flat.nd, self._flat.grad, *(self._buffer(self._state, name) for name in self.state_names))
+            return
+
+        # multi-tensor apply: gather every parameter and grad into flat buffers, run one update, scatter the parameters back
+        xp: ModuleType = tensors[0].xp
+        params: ndarray = self._buffer(self._buffers, "params")
+        grads: ndarray = self._buffer(self._buffers, "grads")
+        xp.concatenate([x.nd.ravel() for x in tensors], out=params)
+        xp.concatenate([x.grad.ravel() for x in tensors], out=grads)
+        self.update(params, grads, *(self._buffer(self._state, name) for name in self.state_names))
+        for x in tensors:
+            offset: int = self._offsets[id(x)]
+            x.nd[...] = params[offset:(offset + x.nd.size)].reshape(x.nd.shape)
+
     def step(self) -> None:
-        def _step(x: Tensor) -> None:
-            x.n_backward = 0
-            self.step_fn(x)
-        self._modify_params(_step)
\ No newline at end of file
+        if self._flat is not None:
+            self._rebind()
+
+        # frozen parameters and parameters that received no grad are left untouched, together with their optimizer state
+        tensors: List[Tensor] = [x for x in self.flat_params if x.requires_grad and (x.grad is not None)]
+        if len(tensors) == 0:
+            return
+
+        # one fused update covers every parameter and needs one shared step count, otherwise each tensor is updated on its own
+        fused: bool = (len(tensors) == len(self.flat_params)) and (len(set(self._steps.get(id(x), 0) for x in tensors)) == 1)
+        if fused and ((self._flat is not None) or (self.foreach and (len(tensors) > 1))):
+            self._fused_step(tensors)
+            return
+        for x in tensors:
+            self.step_fn(x)
\ No newline at end of file
@@ -0,0 +1,85 @@
+from math import sqrt
+from types import ModuleType
+from typing import Union
+import numpy
+from numpy import ndarray
+
+from ..core import available_backends, get_array_module
+
+# fused CuPy update kernels, the NumPy fallbacks below go through a reusable scratch buffer instead of temporaries
+if "cupy" in available_backends():
+    from cupy import ElementwiseKernel
+    _sgd_kernel = ElementwiseKernel("T grad, T lr", "T param", "param -= lr * grad", "quill_sgd")
+    _sgd_momentum_kernel = ElementwiseKernel("T grad, T lr, T momentum", "T velocity, T param", "velocity = momentum * velocity + lr * grad; param -= velocity", "quill_sgd_momentum")
+    _adam_kernel = ElementwiseKernel("T grad, T lr, T beta1, T beta2, T eps, T decay, T step_size, T bias_correction2_sqrt", "T param, T exp_avg, T exp_avg_sq", "param *= decay; exp_avg = beta1 * exp_avg + (1 - beta1) * grad; exp_avg_sq = beta2 * exp_avg_sq + (1 - beta2) * grad * grad; param -= step_size * exp_avg / (sqrt(exp_avg_sq) / bias_correction2_sqrt + eps)", "quill_adam")
+    _rmsprop_kernel = ElementwiseKernel("T grad, T lr, T alpha, T eps", "T param, T square_avg", "square_avg = alpha * square_avg + (1 - alpha) * grad * grad; param -= lr * grad / (sqrt(square_avg) + eps)", "quill_rmsprop")
+    _rmsprop_momentum_kernel = ElementwiseKernel("T grad, T lr, T alpha, T eps, T momentum", "T param, T square_avg, T momentum_buffer", "square_avg = alpha * square_avg + (1 - alpha) * grad * grad; momentum_buffer = momentum * momentum_buffer + grad / (sqrt(square_avg) + eps); param -= lr * momentum_buffer", "quill_rmsprop_momentum")
+
+def sgd_update(param: ndarray, grad: ndarray, lr: float, scratch: ndarray) -> None:
+    xp: ModuleType = get_array_module(param)
+    if xp is not numpy:
+        _sgd_kernel(grad, param.dtype.type(lr), param)
+        return
+    numpy.multiply(grad, lr, out=scratch)
+    param -= scratch
+
+def sgd_momentum_update(param: ndarray, grad: ndarray, velocity: ndarray, lr: float, momentum: float, scratch: ndarray) -> None:
+    xp: ModuleType = get_array_module(param)
+    if xp is not numpy:
+        _sgd_momentum_kernel(grad, param.dtype.type(lr), param.dtype.type(momentum), velocity, param)
+        return
+    numpy.multiply(grad, lr, out=scratch)
+    velocity *= momentum
+    velocity += scratch
+    param -= velocity
+
+def adam_update(param: ndarray, grad: ndarray, exp_avg: ndarray, exp_avg_sq: ndarray, lr: float, beta1: float, beta2: float, eps: float, weight_decay: float, step: int, scratch: ndarray) -> None:
+
+    # bias corrections are folded into two scalars, weight decay is decoupled from the moments (AdamW), 0 gives plain Adam
+    step_size: float = lr / (1 - beta1 ** step)
+    bias_correction2_sqrt: float = sqrt(1 - beta2 ** step)
+    decay: float = 1 - lr * weight_decay
+    xp: ModuleType = get_array_module(param)
+    if xp is not numpy:
+        t: type = param.dtype.type
+        _adam_kernel(grad, t(lr), t(beta1), t(beta2), t(eps), t(decay), t(step_size), t(bias_correction2_sqrt), param, exp_avg, exp_avg_sq)
+        return
+    if weight_decay != 0:
+        param *= decay
+    exp_avg *= beta1
+    numpy.multiply(grad, 1 - beta1, out=scratch)
+    exp_avg += scratch
+    exp_avg_sq *= beta2
+    numpy.multiply(grad, grad, out=scratch)
+    scratch *= 1 - beta2
+    exp_avg_sq += scratch
+    numpy.sqrt(exp_avg_sq, out=scratch)
+    scratch /= bias_correction2_sqrt
+    scratch += eps
+    numpy.divide(exp_avg, scratch, out=scratch)
+    scratch *= step_size
+    param -= scratch
+
+def rmsprop_update(param: ndarray, grad: ndarray, square_avg: ndarray, momentum_buffer: Union[ndarray, None], lr: float, alpha: float, eps: float, momentum: float, scratch: ndarray) -> None:
+    xp: ModuleType = get_array_module(param)
+    if xp is not numpy:
+        t: type = param.dtype.type
+        if momentum_buffer is None:
+            _rmsprop_kernel(grad, t(lr), t(alpha), t(eps), param, square_avg)
+        else:
+            _rmsprop_momentum_kernel(grad, t(lr), t(alpha), t(eps), t(momentum), param, square_avg, momentum_buffer)
+        return
+    square_avg *= alpha
+    numpy.multiply(grad, grad, out=scratch)
+    scratch *= 1 - alpha
+    square_avg += scratch
+    numpy.sqrt(square_avg, out=scratch)
+    scratch += eps
+    numpy.divide(grad, scratch, out=scratch)
+    if momentum_buffer is not None:
+        momentum_buffer *= momentum
+        momentum_buffer += scratch
+        numpy.multiply(momentum_buffer, lr, out=scratch)
+    else:
+        scratch *= lr
+    param -= scratch
\ No newline at end of file
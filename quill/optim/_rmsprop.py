@@ -0,0 +1,38 @@
+from typing import Dict, List, Tuple, Union
+from numpy import ndarray
+
+from . import Optimizer
+from ._optimizer_kernels import rmsprop_update
+from ..core import Tensor
+from ..internals import expr_check, type_check
+
+_State = Union[Tensor, Dict[str, "_State"]]
+
+class RMSProp(Optimizer):
+
+    def __init__(self, params: Union[Dict[str, _State], List[Tensor]], lr: float = 0.01, alpha: float = 0.99, eps: float = 1e-8, momentum: float = 0., contiguous: bool = False, foreach: bool = False):
+        super().__init__(params, contiguous, foreach)
+
+        # TYPE CHECKS
+        type_check(lr, "lr", (int, float))
+        type_check(alpha, "alpha", (int, float))
+        type_check(eps, "eps", (int, float))
+        type_check(momentum, "momentum", (int, float))
+
+        # VALUE OUT OF RANGE CHECKS
+        expr_check(lr, "lr", lambda x: x > 0)
+        expr_check(alpha, "alpha", lambda x: 0 <= x < 1)
+        expr_check(eps, "eps", lambda x: x > 0)
+        expr_check(momentum, "momentum", lambda x: x >= 0)
+
+        self.lr: float = lr
+        self.alpha: float = alpha
+        self.eps: float = eps
+        self.momentum: float = momentum
+
+    @property
+    def state_names(self) -> Tuple[str, ...]:
+        return ("square_avg", "momentum_buffer") if self.momentum != 0 else ("square_avg",)
+
+    def update(self, param: ndarray, grad: ndarray, *state: ndarray) -> None:
+        rmsprop_update(param, grad, state[0], state[1] if self.momentum != 0 else None, self.lr, self.alpha, self.eps, self.momentum, self.scratch(param))
\ No newline at end of file
@@ -1,23 +1,25 @@
-from typing import Dict, Union
+from typing import Dict, List, Tuple, Union
+from numpy import ndarray
 
 from . import Optimizer
+from ._optimizer_kernels import sgd_momentum_update, sgd_update
 from ..core import Tensor
 
 _State = Union[Tensor, Dict[str, "_State"]]
 
 class SGD(Optimizer):
 
-    def __init__(self, params: Dict[str, _State], lr: float = 0.001, momentum: float = 0.):
-        super().__init__(params)
+    def __init__(self, params: Union[Dict[str, _State], List[Tensor]], lr: float = 0.001, momentum: float = 0., contiguous: bool = False, foreach: bool = False):
+        super().__init__(params, contiguous, foreach)
         self.lr: float = lr
         self.momentum: float = momentum
+
+    @property
+    def state_names(self) -> Tuple[str, ...]:
+        return ("velocity",) if self.momentum != 0 else ()
     
-    def step_fn(self, x: Tensor) -> None:
+    def update(self, param: ndarray, grad: ndarray, *state: ndarray) -> None:
         if self.momentum != 0:
-            if self not in x.velocities:
-                x.velocities[self] = self.lr * x.grad
-            else:
-                x.velocities[self] = (self.momentum * x.velocities[self]) + (self.lr * x.grad)
-            x.nd -= x.velocities[self]
+            sgd_momentum_update(param, grad, state[0], self.lr, self.momentum, self.scratch(param))
         else:
-            x.nd -= self.lr * x.grad
\ No newline at end of file
+            sgd_update(param, grad, self.lr, self.scratch(param))
\ No newline at end of file
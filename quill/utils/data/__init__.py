@@ -1,2 +1,13 @@
 from ._dataset import Dataset
-from ._dataloader import DataLoader
\ No newline at end of file
+from ._collate import collate
+from ._sampler import Sampler
+from ._sequential_sampler import SequentialSampler
+from ._random_sampler import RandomSampler
+from ._weighted_random_sampler import WeightedRandomSampler
+from ._distributed_sampler import DistributedSampler
+from ._dataloader import DataLoader
+from ._memmap_dataset import MemmapDataset
+from ._convert_image_folder import convert_image_folder
+from ._convert_csv import convert_csv
+from ._window_dataset import WindowDataset
+from ._image_folder import ImageFolder
\ No newline at end of file
@@ -0,0 +1,46 @@
+from types import ModuleType
+from typing import List, Sequence, Tuple, Union
+import numpy
+from numpy import ndarray
+
+from ...core import Tensor, available_backends, get_array_module, ndarray_types
+
+def _pinned_empty(shape: Tuple[int, ...], dtype: numpy.dtype) -> ndarray:
+    # page-locked host memory from CuPy's pinned memory pool, host-to-device copies from it are faster and can be asynchronous
+    import cupy
+    size: int = int(numpy.prod(shape))
+    memory = cupy.cuda.alloc_pinned_memory(size * numpy.dtype(dtype).itemsize)
+    return numpy.frombuffer(memory, dtype, size).reshape(shape)
+
+def _pinned(xp: ModuleType, pin_memory: bool) -> bool:
+    return pin_memory and (xp is numpy) and ("cupy" in available_backends())
+
+def _empty(xp: ModuleType, shape: Tuple[int, ...], dtype: numpy.dtype, pin_memory: bool) -> ndarray:
+    if _pinned(xp, pin_memory):
+        return _pinned_empty(shape, dtype)
+    return xp.empty(shape, dtype=dtype)
+
+def collate(samples: Union[Sequence[Tuple[Tensor, ...]], Tuple[ndarray, ...]], pin_memory: bool = False) -> Tuple[Tensor, ...]:
+
+    # already-batched columns are wrapped as they are, they are only copied (once) into pinned memory or out of read-only dataset storage
+    if isinstance(samples, tuple) and all(isinstance(column, ndarray_types) for column in samples):
+        columns: List[Tensor] = []
+        for column_nd in samples:
+            xp: ModuleType = get_array_module(column_nd)
+            if _pinned(xp, pin_memory) or (not column_nd.flags.writeable):
+                nd: ndarray = _empty(xp, column_nd.shape, column_nd.dtype, pin_memory)
+                nd[...] = column_nd
+                column_nd = nd
+            columns.append(Tensor(column_nd))
+        return tuple(columns)
+
+    # every column is copied straight into one batch array, the batch tensors are constants without a graph
+    batch: List[Tensor] = []
+    for column in zip(*samples):
+        first: ndarray = column[0].nd
+        xp = get_array_module(first)
+        nd = _empty(xp, (len(column), *first.shape), xp.result_type(*(sample.nd for sample in column)), pin_memory)
+        for i_sample in range(len(column)):
+            nd[i_sample] = column[i_sample].nd
+        batch.append(Tensor(nd))
+    return tuple(batch)
\ No newline at end of file
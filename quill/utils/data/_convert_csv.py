@@ -0,0 +1,52 @@
+import csv
+import os
+from typing import List, Sequence, Tuple, Union
+import numpy
+from numpy import ndarray
+
+from ._memmap_dataset import _open_column, _write_index
+from ...internals import type_check
+
+def _is_number(value: str) -> bool:
+    try:
+        float(value)
+    except ValueError:
+        return False
+    return True
+
+def read_csv(path: str, columns: Union[Sequence[str], None] = None, dtype: str = "float64") -> Tuple[List[str], ndarray]:
+
+    # TYPE CHECKS
+    type_check(path, "path", str)
+    type_check(columns, "columns", (list, tuple, type(None)), str)
+    type_check(dtype, "dtype", str)
+
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        header: List[str] = next(reader)
+        rows: List[List[str]] = [row for row in reader if len(row) > 0]
+
+    # by default every column whose values all parse as numbers is kept (e.g. a date column is dropped)
+    if columns is None:
+        columns = [name for i_column, name in enumerate(header) if all(_is_number(row[i_column]) for row in rows)]
+
+    # VALUE OUT OF RANGE CHECKS
+    for column in columns:
+        if column not in header:
+            raise ValueError(f"Column `{column}` is not in `{path}`, it must be one of these columns: `{header}`.")
+
+    i_columns: List[int] = [header.index(column) for column in columns]
+    return list(columns), numpy.array([[row[i_column] for i_column in i_columns] for row in rows], dtype=numpy.float64).astype(dtype, copy=False)
+
+def convert_csv(path: str, output: str, columns: Union[Sequence[str], None] = None, dtype: str = "float64") -> None:
+
+    # TYPE CHECKS
+    type_check(output, "output", str)
+
+    # parsed once into a single (n_rows, n_columns) column
+    fields, nd = read_csv(path, columns, dtype)
+    os.makedirs(output, exist_ok=True)
+    data: ndarray = _open_column(output, "data", nd.shape, nd.dtype)
+    data[...] = nd
+    data.flush()
+    _write_index(output, len(nd), {"data": data}, fields=fields)
\ No newline at end of file
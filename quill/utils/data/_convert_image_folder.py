@@ -0,0 +1,70 @@
+import os
+from typing import List, Sequence, Tuple, Union
+import numpy
+from numpy import ndarray
+
+from ._memmap_dataset import _open_column, _write_index
+from ...internals import expr_check, len_check, type_check
+
+IMAGE_EXTENSIONS: Tuple[str, ...] = (".bmp", ".gif", ".jpeg", ".jpg", ".png", ".ppm", ".tif", ".tiff", ".webp")
+
+def find_images(root: str) -> Tuple[List[str], List[Tuple[str, int]]]:
+
+    # every subdirectory of root is a class, sorted by name, every image below it is a sample of that class
+    classes: List[str] = sorted(entry.name for entry in os.scandir(root) if entry.is_dir())
+    samples: List[Tuple[str, int]] = []
+    for i_class, name in enumerate(classes):
+        for dirpath, _, filenames in sorted(os.walk(os.path.join(root, name))):
+            for filename in sorted(filenames):
+                if filename.lower().endswith(IMAGE_EXTENSIONS):
+                    samples.append((os.path.join(dirpath, filename), i_class))
+    return classes, samples
+
+def load_image(path: str, size: Sequence[int], mode: str = "RGB") -> ndarray:
+    try:
+        from PIL import Image
+    except ImportError:
+        raise ImportError("Decoding images requires Pillow, install it with `pip install pillow`.")
+
+    # decode, resize to (height, width) and return channels first, as expected by conv2d
+    with Image.open(path) as image:
+        nd: ndarray = numpy.asarray(image.convert(mode).resize((size[1], size[0]), Image.BILINEAR))
+    if nd.ndim == 2:
+        return nd[None]
+    return nd.transpose(2, 0, 1)
+
+def convert_image_folder(root: str, output: str, size: Union[int, Sequence[int]], mode: str = "RGB", dtype: str = "uint8") -> None:
+
+    # TYPE CHECKS
+    type_check(root, "root", str)
+    type_check(output, "output", str)
+    type_check(size, "size", (int, Sequence), int)
+    type_check(mode, "mode", str)
+    type_check(dtype, "dtype", str)
+
+    # cast size into tuple
+    if isinstance(size, int):
+        size = (size, size)
+
+    # MISMATCHED DIMENSION CHECKS
+    len_check(size, "size", 2)
+
+    # VALUE OUT OF RANGE CHECKS
+    expr_check(size[0], "size[0]", lambda x: x > 0)
+    expr_check(size[1], "size[1]", lambda x: x > 0)
+
+    classes, samples = find_images(root)
+    if len(samples) == 0:
+        raise ValueError(f"No images found below `{root}`.")
+
+    # images are decoded once and streamed into an (n, channels, height, width) column, labels into an (n,) column
+    os.makedirs(output, exist_ok=True)
+    first: ndarray = load_image(samples[0][0], size, mode)
+    images: ndarray = _open_column(output, "images", (len(samples), *first.shape), dtype)
+    labels: ndarray = _open_column(output, "labels", (len(samples),), numpy.int64)
+    for i_sample, (path, label) in enumerate(samples):
+        images[i_sample] = first if i_sample == 0 else load_image(path, size, mode)
+        labels[i_sample] = label
+    images.flush()
+    labels.flush()
+    _write_index(output, len(samples), {"images": images, "labels": labels}, classes=classes, files=[os.path.relpath(path, root) for path, _ in samples])
\ No newline at end of file
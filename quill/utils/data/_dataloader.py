@@ -1,20 +1,84 @@
-from typing import Generator, List, Tuple
-from random import shuffle
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Deque, Generator, Iterator, Tuple, Union
+from numpy import ndarray
 
-from . import Dataset
+from . import Dataset, RandomSampler, Sampler, SequentialSampler, collate
 from ...core import Tensor
-from ...nn.functional import stack
+from ...internals import expr_check, type_check
 
 class DataLoader:
 
-    def __init__(self, dataset: Dataset, batch_size: int = 1, shuffle: bool = False) -> None:
+    def __init__(self, dataset: Dataset, batch_size: int = 1, shuffle: bool = False, sampler: Union[Sampler, None] = None, drop_last: bool = False, num_workers: int = 0, prefetch_factor: int = 2, pin_memory: bool = False) -> None:
+
+        # TYPE CHECKS
+        type_check(batch_size, "batch_size", int)
+        type_check(shuffle, "shuffle", bool)
+        type_check(sampler, "sampler", (Sampler, type(None)))
+        type_check(drop_last, "drop_last", bool)
+        type_check(num_workers, "num_workers", int)
+        type_check(prefetch_factor, "prefetch_factor", int)
+        type_check(pin_memory, "pin_memory", bool)
+
+        # VALUE OUT OF RANGE CHECKS
+        expr_check(batch_size, "batch_size", lambda x: x > 0)
+        expr_check(num_workers, "num_workers", lambda x: x >= 0)
+        expr_check(prefetch_factor, "prefetch_factor", lambda x: x > 0)
+
         self.dataset: Dataset = dataset
         self.batch_size: int = batch_size
         self.shuffle: bool = shuffle
+        self.drop_last: bool = drop_last
+        self.num_workers: int = num_workers
+        self.prefetch_factor: int = prefetch_factor
+        self.pin_memory: bool = pin_memory
+
+        # shuffle=True permutes individual samples, an explicit sampler decides the order itself
+        if (sampler is not None) and shuffle:
+            raise ValueError("`sampler` and `shuffle` cannot both be given, pass a RandomSampler to shuffle with an explicit sampler.")
+        if sampler is None:
+            sampler = RandomSampler(dataset) if shuffle else SequentialSampler(dataset)
+        self.sampler: Sampler = sampler
+
+    def __len__(self) -> int:
+        if self.drop_last:
+            return len(self.sampler) // self.batch_size
+        return -(-len(self.sampler) // self.batch_size)
+
+    def _batch_indices(self) -> Generator[ndarray, None, None]:
+        # one index array per epoch, batches are slices of it
+        indices: ndarray = self.sampler.indices()
+        n_batches: int = (len(indices) // self.batch_size) if self.drop_last else -(-len(indices) // self.batch_size)
+        return (indices[(i_batch * self.batch_size):((i_batch + 1) * self.batch_size)] for i_batch in range(n_batches))
+
+    def _fetch(self, indices: ndarray) -> Tuple[Tensor, ...]:
+        return collate(self.dataset.__getitems__(indices.tolist()), self.pin_memory)
+
+    def _prefetch(self, batch_indices: Iterator[ndarray]) -> Generator[Tuple[Tensor, ...], None, None]:
+
+        # up to num_workers * prefetch_factor upcoming batches are decoded and collated in the background, they are yielded in submission order
+        executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=self.num_workers)
+        pending: Deque[Future] = deque()
+        remaining: Iterator[ndarray] = iter(batch_indices)
+        try:
+            for indices in islice(remaining, self.num_workers * self.prefetch_factor):
+                pending.append(executor.submit(self._fetch, indices))
+            while len(pending) > 0:
+                batch: Tuple[Tensor, ...] = pending.popleft().result()
+                for indices in islice(remaining, 1):
+                    pending.append(executor.submit(self._fetch, indices))
+                yield batch
+
+        # stopping early (break, exception, garbage collection) drops the queued batches and joins the workers
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
 
     def __iter__(self) -> Generator[Tuple[Tensor, ...], None, None]:
-        dataset_size: int = len(self.dataset)
-        start_indices: List[int] = list(range(0, dataset_size, self.batch_size))
-        if self.shuffle:
-            shuffle(start_indices)
-        yield from (tuple(stack(column) for column in zip(*(self.dataset[idx] for idx in range(start_idx, min(start_idx + self.batch_size, dataset_size))))) for start_idx in start_indices)
\ No newline at end of file
+        batch_indices: Iterator[ndarray] = self._batch_indices()
+        if self.num_workers == 0:
+            yield from (self._fetch(indices) for indices in batch_indices)
+        else:
+            yield from self._prefetch(batch_indices)
\ No newline at end of file
@@ -1,6 +1,15 @@
 from collections.abc import Sequence
+from typing import List, Tuple, Union
+from numpy import ndarray
+
+from ...core import Tensor
 
 class Dataset(Sequence):
 
     def __init__(self) -> None:
-        super().__init__()
\ No newline at end of file
+        super().__init__()
+
+    def __getitems__(self, indices: List[int]) -> Union[List[Tuple[Tensor, ...]], Tuple[ndarray, ...]]:
+        # batch-fetch hook, returns either one tuple per sample or, for datasets that can read many samples at once (one file read, one fancy index),
+        # one already-batched array per column (batch on the first axis), which collate wraps without a per-sample copy
+        return [self[idx] for idx in indices]
\ No newline at end of file
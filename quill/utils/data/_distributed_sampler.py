@@ -0,0 +1,56 @@
+from collections.abc import Sized
+import numpy
+from numpy import ndarray
+
+from . import Sampler
+from ...internals import expr_check, type_check
+
+class DistributedSampler(Sampler):
+
+    def __init__(self, data_source: Sized, num_replicas: int, rank: int, shuffle: bool = True, seed: int = 0, drop_last: bool = False) -> None:
+
+        # TYPE CHECKS
+        type_check(data_source, "data_source", Sized)
+        type_check(num_replicas, "num_replicas", int)
+        type_check(rank, "rank", int)
+        type_check(shuffle, "shuffle", bool)
+        type_check(seed, "seed", int)
+        type_check(drop_last, "drop_last", bool)
+
+        # VALUE OUT OF RANGE CHECKS
+        expr_check(num_replicas, "num_replicas", lambda x: x > 0)
+        expr_check(rank, "rank", lambda x: 0 <= x < num_replicas)
+
+        self.data_source: Sized = data_source
+        self.num_replicas: int = num_replicas
+        self.rank: int = rank
+        self.shuffle: bool = shuffle
+        self.seed: int = seed
+        self.drop_last: bool = drop_last
+        self.epoch: int = 0
+
+    def set_epoch(self, epoch: int) -> None:
+        # every replica derives the same permutation from (seed, epoch), so the shards never overlap
+        type_check(epoch, "epoch", int)
+        self.epoch = epoch
+
+    @property
+    def total_size(self) -> int:
+        dataset_size: int = len(self.data_source)
+        if self.drop_last:
+            return (dataset_size // self.num_replicas) * self.num_replicas
+        return -(-dataset_size // self.num_replicas) * self.num_replicas
+
+    def indices(self) -> ndarray:
+        dataset_size: int = len(self.data_source)
+        if self.shuffle:
+            indices: ndarray = numpy.random.default_rng((self.seed, self.epoch)).permutation(dataset_size)
+        else:
+            indices = numpy.arange(dataset_size)
+
+        # pad by wrapping around (or truncate with drop_last) so every replica gets the same number of samples
+        indices = numpy.resize(indices, self.total_size)
+        return indices[self.rank::self.num_replicas]
+
+    def __len__(self) -> int:
+        return self.total_size // self.num_replicas
\ No newline at end of file
@@ -0,0 +1,101 @@
+import hashlib
+import os
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Sequence, Tuple, Union
+import numpy
+from numpy import ndarray
+
+from . import Dataset
+from ._convert_image_folder import find_images, load_image
+from ...core import Tensor
+from ...internals import expr_check, len_check, type_check
+
+class ImageFolder(Dataset):
+
+    def __init__(self, root: str, size: Union[int, Sequence[int]], mode: str = "RGB", dtype: str = "float64", cache_size: int = 0, cache_dir: Union[str, None] = None) -> None:
+
+        # Initialize parent class
+        super().__init__()
+
+        # TYPE CHECKS
+        type_check(root, "root", str)
+        type_check(size, "size", (int, Sequence), int)
+        type_check(mode, "mode", str)
+        type_check(dtype, "dtype", str)
+        type_check(cache_size, "cache_size", int)
+        type_check(cache_dir, "cache_dir", (str, type(None)))
+
+        # cast size into tuple
+        if isinstance(size, int):
+            size = (size, size)
+
+        # MISMATCHED DIMENSION CHECKS
+        len_check(size, "size", 2)
+
+        # VALUE OUT OF RANGE CHECKS
+        expr_check(size[0], "size[0]", lambda x: x > 0)
+        expr_check(size[1], "size[1]", lambda x: x > 0)
+        expr_check(cache_size, "cache_size", lambda x: x >= 0)
+
+        self.root: str = root
+        self.size: Tuple[int, int] = tuple(size)
+        self.mode: str = mode
+        self.dtype: numpy.dtype = numpy.dtype(dtype)
+        self.classes, self.samples = find_images(root)
+        self.class_to_idx: Dict[str, int] = {name: i_class for i_class, name in enumerate(self.classes)}
+
+        # decoded images are cached as uint8, in memory (bounded LRU, shared by DataLoader worker threads) and optionally on disk
+        self.cache_size: int = cache_size
+        self.cache_dir: Union[str, None] = cache_dir
+        self._cache: "OrderedDict[int, ndarray]" = OrderedDict()
+        self._lock: Lock = Lock()
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def _cache_path(self, path: str) -> str:
+        # keyed by file and modification time, an edited image gets a new entry instead of a stale hit
+        key: str = f"{os.path.abspath(path)}|{os.stat(path).st_mtime_ns}|{self.size}|{self.mode}"
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode()).hexdigest() + ".npy")
+
+    def _load(self, idx: int) -> ndarray:
+        with self._lock:
+            if idx in self._cache:
+                self._cache.move_to_end(idx)
+                return self._cache[idx]
+
+        path: str = self.samples[idx][0]
+        nd: Union[ndarray, None] = None
+        if self.cache_dir is not None:
+            cache_path: str = self._cache_path(path)
+            if os.path.exists(cache_path):
+                nd = numpy.load(cache_path)
+        if nd is None:
+            nd = load_image(path, self.size, self.mode)
+            if self.cache_dir is not None:
+                # written under a temporary name first so concurrent readers never see a partial file
+                tmp_path: str = f"{cache_path}.{os.getpid()}.{id(nd)}.tmp"
+                with open(tmp_path, "wb") as f:
+                    numpy.save(f, nd)
+                os.replace(tmp_path, cache_path)
+
+        if self.cache_size > 0:
+            with self._lock:
+                self._cache[idx] = nd
+                self._cache.move_to_end(idx)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return nd
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def __getitem__(self, idx: int) -> Tuple[Tensor, Tensor]:
+        nd: ndarray = self._load(idx)
+
+        # float images are scaled to [0, 1]
+        if self.dtype.kind == "f":
+            nd = numpy.multiply(nd, 1 / 255, dtype=self.dtype)
+        elif nd.dtype != self.dtype:
+            nd = nd.astype(self.dtype)
+        return Tensor(nd), Tensor(numpy.array(self.samples[idx][1]))
\ No newline at end of file
@@ -0,0 +1,70 @@
+import json
+import os
+from typing import Any, Dict, List, Sequence, Tuple, Union
+import numpy
+from numpy import ndarray
+
+from . import Dataset
+from ...core import Tensor
+from ...internals import type_check
+
+_INDEX_FILE: str = "index.json"
+
+def _open_column(output: str, name: str, shape: Tuple[int, ...], dtype: Any) -> ndarray:
+    # writable memory map of a new `.npy` column, filled incrementally by the converters
+    return numpy.lib.format.open_memmap(os.path.join(output, f"{name}.npy"), mode="w+", dtype=dtype, shape=shape)
+
+def _write_index(output: str, length: int, columns: Dict[str, ndarray], **metadata: Any) -> None:
+    index: Dict[str, Any] = {"length": length, "columns": {name: {"file": f"{name}.npy", "shape": list(column.shape), "dtype": column.dtype.str} for name, column in columns.items()}}
+    index.update(metadata)
+    with open(os.path.join(output, _INDEX_FILE), "w") as f:
+        json.dump(index, f, indent=2)
+
+class MemmapDataset(Dataset):
+
+    def __init__(self, path: str, columns: Union[Sequence[str], None] = None) -> None:
+
+        # Initialize parent class
+        super().__init__()
+
+        # TYPE CHECKS
+        type_check(path, "path", str)
+        type_check(columns, "columns", (list, tuple, type(None)), str)
+
+        with open(os.path.join(path, _INDEX_FILE)) as f:
+            self.index: Dict[str, Any] = json.load(f)
+        if columns is None:
+            columns = list(self.index["columns"])
+
+        # VALUE OUT OF RANGE CHECKS
+        for column in columns:
+            if column not in self.index["columns"]:
+                raise ValueError(f"Column `{column}` is not in the dataset at `{path}`, it must be one of these columns: `{list(self.index['columns'])}`.")
+
+        self.path: str = path
+        self.columns: List[str] = list(columns)
+        self._open()
+
+    def _open(self) -> None:
+        # read-only memory maps, samples are views (`[idx, ...]` keeps scalar rows as 0-d arrays) into the page cache which every process reading the files shares
+        self.arrays: List[ndarray] = [numpy.load(os.path.join(self.path, self.index["columns"][column]["file"]), mmap_mode="r") for column in self.columns]
+
+    def __len__(self) -> int:
+        return self.index["length"]
+
+    def __getitem__(self, idx: int) -> Tuple[Tensor, ...]:
+        return tuple(Tensor(array[idx, ...]) for array in self.arrays)
+
+    def __getitems__(self, indices: List[int]) -> Tuple[ndarray, ...]:
+        # one fancy-indexed read per column, the result already is the in-memory batch
+        return tuple(array[indices] for array in self.arrays)
+
+    # pickling (e.g. into worker processes) sends the path only, the memory maps are reopened on the other side
+    def __getstate__(self) -> Dict[str, Any]:
+        state: Dict[str, Any] = dict(vars(self))
+        del state["arrays"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        vars(self).update(state)
+        self._open()
\ No newline at end of file
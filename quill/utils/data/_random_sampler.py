@@ -0,0 +1,42 @@
+from collections.abc import Sized
+from typing import Union
+import numpy
+from numpy import ndarray
+from numpy.random import Generator
+
+from . import Sampler
+from ...internals import expr_check, type_check
+
+class RandomSampler(Sampler):
+
+    def __init__(self, data_source: Sized, replacement: bool = False, num_samples: Union[int, None] = None, seed: Union[int, None] = None) -> None:
+
+        # TYPE CHECKS
+        type_check(data_source, "data_source", Sized)
+        type_check(replacement, "replacement", bool)
+        type_check(num_samples, "num_samples", (int, type(None)))
+        type_check(seed, "seed", (int, type(None)))
+
+        # VALUE OUT OF RANGE CHECKS
+        if num_samples is not None:
+            expr_check(num_samples, "num_samples", lambda x: x > 0)
+            if not replacement:
+                expr_check(num_samples, "num_samples", lambda x: x <= len(data_source))
+
+        self.data_source: Sized = data_source
+        self.replacement: bool = replacement
+        self._num_samples: Union[int, None] = num_samples
+        self.generator: Generator = numpy.random.default_rng(seed)
+
+    @property
+    def num_samples(self) -> int:
+        return len(self.data_source) if self._num_samples is None else self._num_samples
+
+    def indices(self) -> ndarray:
+        # a fresh permutation of every sample each epoch
+        if self.replacement:
+            return self.generator.integers(0, len(self.data_source), size=self.num_samples)
+        return self.generator.permutation(len(self.data_source))[:self.num_samples]
+
+    def __len__(self) -> int:
+        return self.num_samples
\ No newline at end of file
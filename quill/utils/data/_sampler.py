@@ -0,0 +1,13 @@
+from typing import Iterator
+from numpy import ndarray
+
+class Sampler:
+
+    def indices(self) -> ndarray:
+        raise NotImplementedError(f"Indices function for {type(self).__name__} sampler has not been implemented yet.")
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.indices().tolist())
+
+    def __len__(self) -> int:
+        raise NotImplementedError(f"Length function for {type(self).__name__} sampler has not been implemented yet.")
\ No newline at end of file
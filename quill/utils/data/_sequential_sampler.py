@@ -0,0 +1,21 @@
+from collections.abc import Sized
+import numpy
+from numpy import ndarray
+
+from . import Sampler
+from ...internals import type_check
+
+class SequentialSampler(Sampler):
+
+    def __init__(self, data_source: Sized) -> None:
+
+        # TYPE CHECKS
+        type_check(data_source, "data_source", Sized)
+
+        self.data_source: Sized = data_source
+
+    def indices(self) -> ndarray:
+        return numpy.arange(len(self.data_source))
+
+    def __len__(self) -> int:
+        return len(self.data_source)
\ No newline at end of file
@@ -0,0 +1,37 @@
+from typing import Sequence, Union
+import numpy
+from numpy import ndarray
+from numpy.random import Generator
+
+from . import Sampler
+from ...internals import expr_check, type_check
+
+class WeightedRandomSampler(Sampler):
+
+    def __init__(self, weights: Union[Sequence[float], ndarray], num_samples: int, replacement: bool = True, seed: Union[int, None] = None) -> None:
+
+        # TYPE CHECKS
+        type_check(weights, "weights", (Sequence, ndarray))
+        type_check(num_samples, "num_samples", int)
+        type_check(replacement, "replacement", bool)
+        type_check(seed, "seed", (int, type(None)))
+
+        # cast weights into a normalized probability vector
+        weights = numpy.asarray(weights, dtype=numpy.float64)
+
+        # VALUE OUT OF RANGE CHECKS
+        expr_check(weights, "weights", lambda x: (x.ndim == 1) and (x >= 0).all() and (x.sum() > 0))
+        expr_check(num_samples, "num_samples", lambda x: x > 0)
+        if not replacement:
+            expr_check(num_samples, "num_samples", lambda x: x <= numpy.count_nonzero(weights))
+
+        self.weights: ndarray = weights / weights.sum()
+        self.num_samples: int = num_samples
+        self.replacement: bool = replacement
+        self.generator: Generator = numpy.random.default_rng(seed)
+
+    def indices(self) -> ndarray:
+        return self.generator.choice(len(self.weights), size=self.num_samples, replace=self.replacement, p=self.weights)
+
+    def __len__(self) -> int:
+        return self.num_samples
\ No newline at end of file
@@ -0,0 +1,95 @@
+from typing import List, Sequence, Tuple, Union
+import numpy
+from numpy import ndarray
+
+from . import Dataset
+from ._convert_csv import read_csv
+from ...core import Tensor
+from ...internals import expr_check, type_check
+
+class WindowDataset(Dataset):
+
+    def __init__(self, series: ndarray, window_size: int, horizon: int = 1, stride: int = 1, target_columns: Union[Sequence[int], None] = None, normalize: bool = False, mean: Union[ndarray, None] = None, std: Union[ndarray, None] = None) -> None:
+
+        # Initialize parent class
+        super().__init__()
+
+        # TYPE CHECKS
+        type_check(series, "series", ndarray)
+        type_check(window_size, "window_size", int)
+        type_check(horizon, "horizon", int)
+        type_check(stride, "stride", int)
+        type_check(target_columns, "target_columns", (list, tuple, type(None)), int)
+        type_check(normalize, "normalize", bool)
+        type_check(mean, "mean", (ndarray, type(None)))
+        type_check(std, "std", (ndarray, type(None)))
+
+        # cast series into (time, features)
+        if series.ndim == 1:
+            series = series[:, None]
+
+        # MISMATCHED DIMENSION CHECKS
+        if series.ndim != 2:
+            raise IndexError(f"Series must be of shape (time,) or (time, features), it cannot be of shape {series.shape}.")
+
+        # VALUE OUT OF RANGE CHECKS
+        expr_check(window_size, "window_size", lambda x: x > 0)
+        expr_check(horizon, "horizon", lambda x: x >= 0)
+        expr_check(stride, "stride", lambda x: x > 0)
+        if series.shape[0] < window_size + horizon:
+            raise ValueError(f"Series of length {series.shape[0]} is shorter than window_size + horizon = {window_size + horizon}.")
+
+        # normalization statistics are computed once (or reused, e.g. from the training split) and applied to the stored series
+        self.mean: Union[ndarray, None] = mean
+        self.std: Union[ndarray, None] = std
+        if normalize or (mean is not None) or (std is not None):
+            if self.mean is None:
+                self.mean = series.mean(axis=0)
+            if self.std is None:
+                self.std = series.std(axis=0)
+                self.std[self.std == 0] = 1
+            series = (series - self.mean) / self.std
+
+        self.series: ndarray = series
+        self.window_size: int = window_size
+        self.horizon: int = horizon
+        self.stride: int = stride
+        self.target_columns: List[int] = list(range(series.shape[1])) if target_columns is None else list(target_columns)
+
+        # windows and horizons are strided views of the single stored series, nothing is copied per window
+        n_windows: int = ((series.shape[0] - window_size - horizon) // stride) + 1
+        s_time, s_feature = series.strides
+        self.windows: ndarray = numpy.lib.stride_tricks.as_strided(series, shape=(n_windows, window_size, series.shape[1]), strides=(s_time * stride, s_time, s_feature), writeable=False)
+        columns: List[int] = self.target_columns
+        if columns == list(range(columns[0], columns[0] + len(columns))):
+            targets: ndarray = series[window_size:, columns[0]:(columns[0] + len(columns))]
+        else:
+            targets = series[window_size:, columns]
+        self.targets: ndarray = numpy.lib.stride_tricks.as_strided(targets, shape=(n_windows, horizon, targets.shape[1]), strides=(targets.strides[0] * stride, *targets.strides), writeable=False)
+
+    @classmethod
+    def from_csv(cls, path: str, window_size: int, columns: Union[Sequence[str], None] = None, target_columns: Union[Sequence[str], None] = None, **kwargs) -> "WindowDataset":
+        fields, series = read_csv(path, columns)
+        if target_columns is not None:
+            for column in target_columns:
+                if column not in fields:
+                    raise ValueError(f"Target column `{column}` must be one of these columns: `{fields}`.")
+            kwargs["target_columns"] = [fields.index(column) for column in target_columns]
+        return cls(series, window_size, **kwargs)
+
+    def denormalize(self, nd: ndarray, columns: Union[Sequence[int], None] = None) -> ndarray:
+        if self.mean is None:
+            return nd
+        if columns is None:
+            columns = self.target_columns
+        return (nd * self.std[columns]) + self.mean[columns]
+
+    def __len__(self) -> int:
+        return self.windows.shape[0]
+
+    def __getitem__(self, idx: int) -> Tuple[Tensor, Tensor]:
+        return Tensor(self.windows[idx]), Tensor(self.targets[idx])
+
+    def __getitems__(self, indices: List[int]) -> Tuple[ndarray, ndarray]:
+        # one gather per batch straight out of the strided views, collate wraps the result without copying it again
+        return self.windows[indices], self.targets[indices]
\ No newline at end of file
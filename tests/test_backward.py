@@ -0,0 +1,39 @@
+import numpy
+import pytest
+
+from quill.core import Tensor
+from quill.nn.functional import multiply, sum
+
+def shared_graph():
+    w = Tensor(numpy.array([1., 2.]), requires_grad=True)
+    h = multiply(w, Tensor(numpy.array([2., 2.])))
+    return w, h, sum(h), sum(multiply(h, h))
+
+def test_second_backward_through_freed_graph_raises():
+    w, h, l1, l2 = shared_graph()
+    l1.backward()
+    with pytest.raises(AssertionError):
+        l2.backward()
+
+    # the failed backward must not have touched any gradient
+    numpy.testing.assert_array_equal(w.grad, [2., 2.])
+
+def test_second_backward_of_the_same_root_raises():
+    w, h, l1, l2 = shared_graph()
+    l1.backward()
+    with pytest.raises(AssertionError):
+        l1.backward()
+
+def test_retain_graph_allows_backward_through_shared_intermediates():
+    w, h, l1, l2 = shared_graph()
+    l1.backward(retain_graph=True)
+    l2.backward()
+
+    # d(sum(2w))/dw + d(sum(4w^2))/dw = 2 + 8w
+    numpy.testing.assert_allclose(w.grad, [10., 18.])
+
+def test_retain_graph_accumulates_over_repeated_backward():
+    w, h, l1, l2 = shared_graph()
+    l1.backward(retain_graph=True)
+    l1.backward()
+    numpy.testing.assert_array_equal(w.grad, [4., 4.])
\ No newline at end of file
@@ -0,0 +1,19 @@
+import numpy
+
+from quill.core import Tensor, no_grad
+from quill.nn import Linear
+from quill.nn.functional import multiply
+
+def test_leaf_created_under_no_grad_keeps_requires_grad():
+    with no_grad():
+        w = Tensor(numpy.ones(2), requires_grad=True)
+        linear = Linear(2, 2)
+    assert w.requires_grad
+    assert all(x.requires_grad for x in linear.flat_parameters())
+
+def test_result_under_no_grad_records_no_graph():
+    w = Tensor(numpy.ones(2), requires_grad=True)
+    with no_grad():
+        y = multiply(w, w)
+    assert not y.requires_grad
+    assert y.parents == []
\ No newline at end of file
@@ -0,0 +1,23 @@
+import numpy
+import pytest
+
+from quill.core import Tensor
+from quill.internals import get_validation_level, set_validation_level
+from quill.nn.functional import bcewithlogitsloss, crossentropyloss, mseloss
+
+@pytest.mark.parametrize("level", ["full", "boundary", "off"])
+@pytest.mark.parametrize("loss", [mseloss, crossentropyloss, bcewithlogitsloss])
+def test_unknown_reduction_raises_at_every_validation_level(level, loss):
+    previous = get_validation_level()
+    set_validation_level(level)
+    try:
+        with pytest.raises(ValueError):
+            loss(Tensor(numpy.zeros((2, 3))), Tensor(numpy.zeros((2, 3))), reduction="avg")
+    finally:
+        set_validation_level(previous)
+
+@pytest.mark.parametrize("reduction, expected", [("mean", 0.5), ("sum", 3.)])
+def test_mseloss_reduces_to_a_scalar(reduction, expected):
+    y = mseloss(Tensor(numpy.ones((2, 3))), Tensor(numpy.zeros((2, 3))), reduction=reduction)
+    assert y.nd.shape == ()
+    assert y.nd == expected
\ No newline at end of file
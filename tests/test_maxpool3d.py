@@ -0,0 +1,68 @@
+import numpy
+import pytest
+
+from quill.core import Tensor
+from quill.nn.functional import maxpool3d
+
+def reference_maxpool(nd, kernel_size, stride):
+    # direct loop over every window
+    output_height = ((nd.shape[-2] - kernel_size[0]) // stride[0]) + 1
+    output_width = ((nd.shape[-1] - kernel_size[1]) // stride[1]) + 1
+    y = numpy.empty((*nd.shape[:-2], output_height, output_width))
+    for i in range(output_height):
+        for j in range(output_width):
+            window = nd[..., (i * stride[0]):(i * stride[0] + kernel_size[0]), (j * stride[1]):(j * stride[1] + kernel_size[1])]
+            y[..., i, j] = window.max(axis=(-2, -1))
+    return y
+
+def backward(x, kernel_size, stride, grad):
+    y = maxpool3d(x, kernel_size, stride)
+    y.accumulate_grad(grad)
+    y.grad_fn(y)
+    return x.grad
+
+@pytest.mark.parametrize("shape", [(2, 7, 7), (2, 3, 8, 6)])
+@pytest.mark.parametrize("kernel_size, stride", [((2, 2), (2, 2)), ((3, 3), (1, 1)), ((3, 2), (2, 1))])
+def test_forward_matches_loop(shape, kernel_size, stride):
+    nd = numpy.random.default_rng(0).standard_normal(shape)
+    y = maxpool3d(Tensor(nd), kernel_size, stride)
+    numpy.testing.assert_allclose(y.nd, reference_maxpool(nd, kernel_size, stride))
+
+@pytest.mark.parametrize("kernel_size, stride", [((3, 3), (1, 1)), ((3, 3), (2, 2)), ((2, 3), (1, 2))])
+def test_overlapping_windows_gradient_matches_finite_differences(kernel_size, stride):
+    rng = numpy.random.default_rng(1)
+
+    # distinct values keep every maximum away from a tie, so the loss is differentiable
+    nd = rng.permutation(2 * 3 * 7 * 7).reshape((2, 3, 7, 7)).astype(numpy.float64)
+    grad = rng.standard_normal(reference_maxpool(nd, kernel_size, stride).shape)
+    analytic = backward(Tensor(nd.copy(), requires_grad=True), kernel_size, stride, grad)
+
+    eps = 1e-3
+    numeric = numpy.zeros_like(nd)
+    for index in numpy.ndindex(nd.shape):
+        shifted = nd.copy()
+        shifted[index] += eps
+        plus = (reference_maxpool(shifted, kernel_size, stride) * grad).sum()
+        shifted[index] -= 2 * eps
+        minus = (reference_maxpool(shifted, kernel_size, stride) * grad).sum()
+        numeric[index] = (plus - minus) / (2 * eps)
+    numpy.testing.assert_allclose(analytic, numeric, atol=1e-6)
+
+def test_tied_window_sends_gradient_to_first_maximum():
+    x = Tensor(numpy.ones((1, 2, 2)), requires_grad=True)
+    grad = backward(x, (2, 2), (2, 2), numpy.full((1, 1, 1), 5.))
+    numpy.testing.assert_array_equal(grad, [[[5., 0.], [0., 0.]]])
+
+def test_tied_overlapping_windows_accumulate_on_first_maxima():
+    # every window of a constant input is a tie, each one routes its gradient to its own top-left element
+    x = Tensor(numpy.zeros((1, 3, 3)), requires_grad=True)
+    grad = backward(x, (2, 2), (1, 1), numpy.array([[[1., 2.], [3., 4.]]]))
+    numpy.testing.assert_array_equal(grad, [[[1., 2., 0.], [3., 4., 0.], [0., 0., 0.]]])
+
+def test_overlapping_windows_sharing_a_maximum_accumulate():
+    nd = numpy.zeros((1, 3, 3))
+    nd[0, 1, 1] = 1.
+    grad = backward(Tensor(nd, requires_grad=True), (2, 2), (1, 1), numpy.ones((1, 2, 2)))
+    expected = numpy.zeros((1, 3, 3))
+    expected[0, 1, 1] = 4.
+    numpy.testing.assert_array_equal(grad, expected)
\ No newline at end of file